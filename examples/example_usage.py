@@ -15,6 +15,13 @@ from flowco.core.engine import BusinessEvaluationEngine
 from flowco.output.report_generator import ReportGenerator
 from flowco.output.template_generator import TemplateGenerator
 
+# uvloop (installed with uvicorn[standard]) is a faster drop-in event loop
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 
 async def example_evaluation():
     """Example business concept evaluation."""
@@ -122,47 +129,59 @@ async def example_evaluation():
         output_dir = Path("example_output")
         output_dir.mkdir(exist_ok=True)
         
-        # Generate different report formats
+        # Generate different report formats concurrently
         formats = ["markdown", "html", "json"]
-        for format_type in formats:
-            try:
-                output_path = output_dir / f"business_evaluation.{format_type}"
-                await report_generator.generate_report(
+        report_paths = [output_dir / f"business_evaluation.{format_type}" for format_type in formats]
+        report_results = await asyncio.gather(
+            *(
+                report_generator.generate_report(
                     business_concept, result, format=format_type, output_path=str(output_path)
                 )
+                for format_type, output_path in zip(formats, report_paths)
+            ),
+            return_exceptions=True
+        )
+        for format_type, output_path, report_result in zip(formats, report_paths, report_results):
+            if isinstance(report_result, Exception):
+                print(f"❌ Failed to generate {format_type} report: {str(report_result)}")
+            else:
                 print(f"✅ Generated {format_type.upper()} report: {output_path}")
-            except Exception as e:
-                print(f"❌ Failed to generate {format_type} report: {str(e)}")
         
         # Generate marketing materials
         print("\n🎨 Generating marketing materials...")
-        template_generator = TemplateGenerator()
+        template_generator = TemplateGenerator(engine.ai_client)
         
-        try:
-            # Generate landing page
-            landing_page_path = output_dir / "landing_page.html"
-            await template_generator.generate_landing_page(
+        landing_page_path = output_dir / "landing_page.html"
+        business_card_path = output_dir / "business_card.html"
+        landing_page, business_card, marketing_files = await asyncio.gather(
+            template_generator.generate_landing_page(
                 business_concept, result, str(landing_page_path)
-            )
-            print(f"✅ Generated landing page: {landing_page_path}")
-            
-            # Generate business card
-            business_card_path = output_dir / "business_card.html"
-            await template_generator.generate_business_card(
+            ),
+            template_generator.generate_business_card(
                 business_concept, result, str(business_card_path)
-            )
-            print(f"✅ Generated business card: {business_card_path}")
-            
-            # Generate complete marketing materials
-            marketing_files = await template_generator.generate_marketing_materials(
+            ),
+            template_generator.generate_marketing_materials(
                 business_concept, result, str(output_dir / "marketing")
-            )
+            ),
+            return_exceptions=True
+        )
+        
+        if isinstance(landing_page, Exception):
+            print(f"❌ Failed to generate landing page: {str(landing_page)}")
+        else:
+            print(f"✅ Generated landing page: {landing_page_path}")
+        
+        if isinstance(business_card, Exception):
+            print(f"❌ Failed to generate business card: {str(business_card)}")
+        else:
+            print(f"✅ Generated business card: {business_card_path}")
+        
+        if isinstance(marketing_files, Exception):
+            print(f"❌ Failed to generate marketing materials: {str(marketing_files)}")
+        else:
             print(f"✅ Generated marketing materials:")
             for material_type, file_path in marketing_files.items():
                 print(f"   • {material_type}: {file_path}")
-                
-        except Exception as e:
-            print(f"❌ Failed to generate marketing materials: {str(e)}")
         
         print(f"\n🎉 Evaluation complete! Check the '{output_dir}' directory for all generated files.")
         
@@ -249,6 +268,11 @@ async def example_api_simulation():
         print(f"❌ API simulation failed: {str(e)}")
 
 
+async def run_examples():
+    """Run the independent examples concurrently in one event loop."""
+    await asyncio.gather(example_evaluation(), example_api_simulation())
+
+
 def main():
     """Main example function."""
     print("🧠 FlowCo - AI Business Success Evaluation System")
@@ -256,8 +280,7 @@ def main():
     print("=" * 60)
     
     # Run examples
-    asyncio.run(example_evaluation())
-    asyncio.run(example_api_simulation())
+    asyncio.run(run_examples())
     
     print("\n" + "=" * 60)
     print("✨ Examples completed!")
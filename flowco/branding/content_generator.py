@@ -1,36 +1,279 @@
 """Branding and marketing content generation."""
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-import random
-import colorsys
+import re
+from dataclasses import dataclass
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 
-from ..models.business import BusinessConcept
+import numpy as np
+
+from ..models.business import BusinessCategory, BusinessConcept
 from ..models.evaluation import BrandingRecommendations, MarketInsights
-from ..core.ai_client import AIClient
+from ..core.ai_client import AIClient, AIClientError
 
 logger = logging.getLogger(__name__)
 
+# Leading bullet points, numbering and whitespace on AI list items
+_LIST_PREFIX_RE = re.compile(r'^[\d.\-\*\+\s]+')
+
+# "SECTION: text" lines in the website copy response
+_COPY_LINE_RE = re.compile(r'^[ \t]*(HERO|ABOUT|SERVICES|CTA):(.*)$', re.MULTILINE)
+
+_DEFAULT_WEBSITE_COPY: Dict[str, str] = {
+    'hero': 'Transform Your Business Today',
+    'about': 'We provide innovative solutions for modern businesses.',
+    'services': 'Our comprehensive services are designed to meet your needs.',
+    'cta': 'Get Started Now'
+}
+
+# Color palettes for different business types, keyed by category value
+_COLOR_PALETTES: Dict[str, Tuple[str, ...]] = {
+    BusinessCategory.TECHNOLOGY.value: ("#007ACC", "#4A90E2", "#50C878", "#FF6B35", "#2E3440"),
+    BusinessCategory.RETAIL.value: ("#E74C3C", "#F39C12", "#27AE60", "#8E44AD", "#34495E"),
+    BusinessCategory.FOOD_BEVERAGE.value: ("#E67E22", "#C0392B", "#F1C40F", "#27AE60", "#8B4513"),
+    BusinessCategory.HEALTH_FITNESS.value: ("#2ECC71", "#3498DB", "#E74C3C", "#F39C12", "#95A5A6"),
+    BusinessCategory.EDUCATION.value: ("#3498DB", "#9B59B6", "#E67E22", "#1ABC9C", "#34495E"),
+    BusinessCategory.ENTERTAINMENT.value: ("#E91E63", "#9C27B0", "#FF5722", "#FFC107", "#607D8B"),
+    BusinessCategory.FINANCE.value: ("#2C3E50", "#34495E", "#1ABC9C", "#3498DB", "#95A5A6"),
+    BusinessCategory.PROFESSIONAL_SERVICES.value: ("#34495E", "#2C3E50", "#3498DB", "#1ABC9C", "#95A5A6"),
+    "default": ("#3498DB", "#E74C3C", "#2ECC71", "#F39C12", "#9B59B6"),
+}
+
+_HEX_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+# Palette entries are parsed below without per-color error handling, so reject
+# malformed ones at import instead
+for _name, _palette in _COLOR_PALETTES.items():
+    for _color in _palette:
+        if not _HEX_RE.match(_color):
+            raise ValueError(f"Invalid color {_color!r} in {_name} palette")
+
+
+def _extend_palette(palette: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Add the complements of the first two colors to a palette, up to 8 colors."""
+    rgb = np.frombuffer(
+        bytes.fromhex("".join(color[1:] for color in palette[:2])), dtype=np.uint8
+    ).reshape(-1, 3).astype(np.int16)
+    
+    # Rotating the HSV hue by 180 degrees maps each channel c to
+    # max(rgb) + min(rgb) - c
+    complements = rgb.max(axis=1, keepdims=True) + rgb.min(axis=1, keepdims=True) - rgb
+    
+    extended = list(palette)
+    for comp_rgb in complements.astype(np.uint8):
+        comp_hex = "#" + comp_rgb.tobytes().hex()
+        if comp_hex not in extended:
+            extended.append(comp_hex)
+    
+    return tuple(extended[:8])
+
+
+# The palette depends only on the category, so every one is extended once at
+# import. str-valued categories hash and compare like their values, so the
+# enum members look up directly.
+_CATEGORY_PALETTES: Dict[str, Tuple[str, ...]] = {
+    name: _extend_palette(palette) for name, palette in _COLOR_PALETTES.items()
+}
+
+
+# Prompt templates keyed by template id, filled from _PromptContext fields
+_PROMPT_TEMPLATES: Dict[str, str] = {
+    "brand_positioning": """\
+Create a brand positioning statement for this business concept:
+
+Business Concept: {concept_description}
+Product/Service: {product_description}
+Target Demographics: {demographics}
+Competition Level: {competition_level}
+Key Market Trends: {market_trends}
+
+Create a clear, compelling brand positioning statement that:
+1. Defines the target audience
+2. Identifies the category/market
+3. States the unique value proposition
+4. Differentiates from competitors
+
+Format as a concise positioning statement (2-3 sentences).
+""",
+    "key_messaging": """\
+Generate key marketing messages for this business concept:
+
+Business Concept: {concept_description}
+Product Features: {features}
+Competitive Advantages: {competitive_advantages}
+Target Audience: {audience}
+
+Create 5-7 key marketing messages that:
+1. Highlight unique benefits
+2. Address customer pain points
+3. Emphasize value proposition
+4. Resonate with target audience
+5. Differentiate from competitors
+
+Format as short, punchy messages, one per line.
+""",
+    "visual_identity": """\
+Generate visual identity suggestions for this business concept:
+
+Business Concept: {concept_description}
+Product Category: {category}
+Target Demographics: {audience}
+Product Analysis: {design_quality}
+
+Suggest visual identity elements including:
+1. Overall design style (modern, classic, minimalist, etc.)
+2. Typography recommendations
+3. Imagery style
+4. Visual tone and mood
+5. Brand personality expression
+
+Format as specific suggestions, one per line.
+""",
+    "marketing_channels": """\
+Recommend marketing channels for this business concept:
+
+Business Concept: {concept_description}
+Target Demographics: {demographics}
+Target Interests: {interests}
+Market Size: {market_size}
+Competition Level: {competition_level}
+
+Recommend 5-7 marketing channels considering:
+1. Target audience preferences
+2. Budget efficiency
+3. Market reach potential
+4. Competition level
+5. Local vs. digital opportunities
+
+Format as specific channels, one per line.
+""",
+    "content_strategy": """\
+Create a content marketing strategy for this business concept:
+
+Business Concept: {concept_description}
+Target Demographics: {audience}
+Target Interests: {interests}
+Market Trends: {market_trends}
+
+Provide a content strategy covering:
+1. Content themes and topics
+2. Content formats and types
+3. Publishing frequency and schedule
+4. Audience engagement approach
+5. Content distribution strategy
+
+Format as a comprehensive strategy (2-3 paragraphs).
+""",
+    "logo_concepts": """\
+Generate logo concept ideas for this business:
+
+Business Concept: {concept_description}
+Product/Service: {product_description}
+Business Name: {business_name}
+
+Create 5-6 logo concept ideas that:
+1. Reflect the business nature
+2. Appeal to target audience
+3. Are memorable and distinctive
+4. Work across different media
+5. Convey brand personality
+
+Format as concept descriptions, one per line.
+""",
+    "commercial_script": """\
+Create a 30-second commercial script for this business:
+
+Business Concept: {concept_description}
+Product/Service: {product_description}
+Brand Positioning: {brand_positioning}
+Target Audience: {audience}
+
+Create an engaging 30-second commercial script that:
+1. Grabs attention in the first 5 seconds
+2. Clearly communicates the value proposition
+3. Includes a strong call to action
+4. Resonates with the target audience
+5. Reflects the brand positioning
+
+Format as a proper script with scene descriptions and dialogue.
+""",
+    "website_copy": """\
+Generate website copy for this business:
+
+Business Concept: {concept_description}
+Brand Positioning: {brand_positioning}
+Key Messages: {key_messages}
+
+Create copy for:
+1. Hero headline (compelling, benefit-focused)
+2. About section (2-3 sentences)
+3. Services/Products section (brief description)
+4. Call-to-action text
+
+Format as:
+HERO: [headline]
+ABOUT: [about text]
+SERVICES: [services text]
+CTA: [call-to-action]
+""",
+}
+
+
+@dataclass(frozen=True)
+class _PromptContext:
+    """Prompt fields shared by the branding prompts, built once per run."""
+    
+    concept_description: str
+    product_description: str
+    business_name: str
+    category: str
+    audience: str
+    demographics: str
+    interests: str
+    features: str
+    competitive_advantages: str
+    market_trends: str
+    market_size: str
+    competition_level: str
+    
+    @classmethod
+    def build(cls, concept: BusinessConcept, market_insights: MarketInsights) -> "_PromptContext":
+        """Derive the prompt fields from a concept and its market insights."""
+        demographics = concept.target_demographics
+        product_info = concept.product_info
+        audience = f"Age {demographics.age_min}-{demographics.age_max}, {demographics.income_range}"
+        
+        return cls(
+            concept_description=concept.concept_description,
+            product_description=product_info.description or 'Not specified',
+            business_name=product_info.name or 'Not specified',
+            category=f"{product_info.category or 'General'}",
+            audience=audience,
+            demographics=f"{audience}, {demographics.location}",
+            interests=', '.join(demographics.interests) if demographics.interests else 'Not specified',
+            features=', '.join(product_info.features) if product_info.features else 'Not specified',
+            competitive_advantages=', '.join(concept.competitive_advantages) if concept.competitive_advantages else 'Not specified',
+            market_trends=', '.join(market_insights.market_trends[:3]),
+            market_size=f"{market_insights.market_size}",
+            competition_level=f"{market_insights.competition_level}"
+        )
+    
+    def render(self, template_id: str, **extra: str) -> str:
+        """Fill a prompt template from these fields plus any extra values."""
+        return _PROMPT_TEMPLATES[template_id].format_map({**vars(self), **extra})
+
 
 class ContentGenerator:
     """Generates branding and marketing content."""
     
-    def __init__(self):
-        """Initialize content generator."""
-        self.ai_client = AIClient()
+    def __init__(self, ai_client: Optional[AIClient] = None):
+        """Initialize content generator.
         
-        # Color palettes for different business types
-        self.color_palettes = {
-            "technology": ["#007ACC", "#4A90E2", "#50C878", "#FF6B35", "#2E3440"],
-            "retail": ["#E74C3C", "#F39C12", "#27AE60", "#8E44AD", "#34495E"],
-            "food_beverage": ["#E67E22", "#C0392B", "#F1C40F", "#27AE60", "#8B4513"],
-            "health_fitness": ["#2ECC71", "#3498DB", "#E74C3C", "#F39C12", "#95A5A6"],
-            "education": ["#3498DB", "#9B59B6", "#E67E22", "#1ABC9C", "#34495E"],
-            "entertainment": ["#E91E63", "#9C27B0", "#FF5722", "#FFC107", "#607D8B"],
-            "finance": ["#2C3E50", "#34495E", "#1ABC9C", "#3498DB", "#95A5A6"],
-            "professional_services": ["#34495E", "#2C3E50", "#3498DB", "#1ABC9C", "#95A5A6"],
-            "default": ["#3498DB", "#E74C3C", "#2ECC71", "#F39C12", "#9B59B6"]
-        }
+        Args:
+            ai_client: Shared AI client (optional, a new one is created if omitted)
+        """
+        self.ai_client = ai_client or AIClient()
     
     async def generate_branding_recommendations(
         self, 
@@ -52,376 +295,235 @@ class ContentGenerator:
         logger.info("Generating branding recommendations")
         
         try:
-            # Generate brand positioning
-            brand_positioning = await self._generate_brand_positioning(concept, market_insights)
-            
-            # Generate key messaging
-            key_messaging = await self._generate_key_messaging(concept, market_insights)
+            ctx = _PromptContext.build(concept, market_insights)
             
-            # Generate visual identity suggestions
-            visual_identity = await self._generate_visual_identity_suggestions(concept, product_analysis)
-            
-            # Recommend marketing channels
-            marketing_channels = await self._recommend_marketing_channels(concept, market_insights)
-            
-            # Generate content strategy
-            content_strategy = await self._generate_content_strategy(concept, market_insights)
+            # The AI-backed sections are independent of one another, so dispatch
+            # them concurrently; only the commercial script needs the positioning.
+            (
+                text_sections,
+                key_messaging,
+                visual_identity,
+                marketing_channels,
+                logo_concepts,
+            ) = await asyncio.gather(
+                self._generate_text_sections(ctx),
+                self._generate_key_messaging(ctx),
+                self._generate_visual_identity_suggestions(ctx, product_analysis),
+                self._recommend_marketing_channels(ctx),
+                self._generate_logo_concepts(ctx),
+                return_exceptions=True
+            )
             
-            # Generate logo concepts
-            logo_concepts = await self._generate_logo_concepts(concept)
+            if isinstance(text_sections, Exception):
+                logger.error("Error generating branding text sections: %s", text_sections)
+                text_sections = (
+                    "Brand positioning statement unavailable",
+                    "Content strategy unavailable"
+                )
+            brand_positioning, content_strategy = text_sections
+            if isinstance(key_messaging, Exception):
+                logger.error("Error generating key messaging: %s", key_messaging)
+                key_messaging = ["Key messaging unavailable"]
+            if isinstance(visual_identity, Exception):
+                logger.error("Error generating visual identity suggestions: %s", visual_identity)
+                visual_identity = ["Visual identity suggestions unavailable"]
+            if isinstance(marketing_channels, Exception):
+                logger.error("Error recommending marketing channels: %s", marketing_channels)
+                marketing_channels = ["Marketing channel recommendations unavailable"]
+            if isinstance(logo_concepts, Exception):
+                logger.error("Error generating logo concepts: %s", logo_concepts)
+                logo_concepts = ["Logo concept ideas unavailable"]
             
             # Generate color palette
             color_palette = self._generate_color_palette(concept)
             
             # Generate commercial script
-            commercial_script = await self._generate_commercial_script(concept, brand_positioning)
+            commercial_script = await self._generate_commercial_script(ctx, brand_positioning)
             
-            return BrandingRecommendations(
+            # Every field is produced above with the right type, so skip
+            # re-validating them
+            return BrandingRecommendations.model_construct(
                 brand_positioning=brand_positioning,
-                key_messaging=key_messaging,
-                visual_identity_suggestions=visual_identity,
-                marketing_channels=marketing_channels,
+                key_messaging=tuple(key_messaging),
+                visual_identity_suggestions=tuple(visual_identity),
+                marketing_channels=tuple(marketing_channels),
                 content_strategy=content_strategy,
-                logo_concepts=logo_concepts,
+                logo_concepts=tuple(logo_concepts),
                 color_palette=color_palette,
                 commercial_script=commercial_script
             )
             
         except Exception as e:
-            logger.error(f"Error generating branding recommendations: {str(e)}")
-            return BrandingRecommendations(
+            logger.error("Error generating branding recommendations: %s", e)
+            return BrandingRecommendations.model_construct(
                 brand_positioning="Brand positioning unavailable",
                 content_strategy="Content strategy unavailable"
             )
     
-    async def _generate_brand_positioning(
-        self, 
-        concept: BusinessConcept, 
-        market_insights: MarketInsights
-    ) -> str:
-        """Generate brand positioning statement."""
-        
-        positioning_prompt = f"""
-        Create a brand positioning statement for this business concept:
+    async def _generate_text_sections(self, ctx: _PromptContext) -> Tuple[str, str]:
+        """Generate the brand positioning and content strategy.
         
-        Business Concept: {concept.concept_description}
-        Product/Service: {concept.product_info.description or 'Not specified'}
-        Target Demographics: Age {concept.target_demographics.age_min}-{concept.target_demographics.age_max}, {concept.target_demographics.income_range}, {concept.target_demographics.location}
-        Competition Level: {market_insights.competition_level}
-        Key Market Trends: {', '.join(market_insights.market_trends[:3])}
-        
-        Create a clear, compelling brand positioning statement that:
-        1. Defines the target audience
-        2. Identifies the category/market
-        3. States the unique value proposition
-        4. Differentiates from competitors
-        
-        Format as a concise positioning statement (2-3 sentences).
+        These free-text sections are submitted to the AI client as one batch.
         """
-        
-        try:
-            response = await self.ai_client.generate_text(positioning_prompt, max_tokens=200)
-            return response.strip()
-        except Exception as e:
-            logger.error(f"Error generating brand positioning: {str(e)}")
-            return "Brand positioning statement unavailable"
+        responses = await self.ai_client.generate_text_batch(
+            [ctx.render("brand_positioning"), ctx.render("content_strategy")],
+            max_tokens=[200, 400],
+            template_ids=["brand_positioning", "content_strategy"],
+            return_exceptions=True
+        )
+        
+        sections = []
+        for response, name, fallback in zip(
+            responses,
+            ("brand positioning", "content strategy"),
+            ("Brand positioning statement unavailable", "Content strategy unavailable")
+        ):
+            if isinstance(response, (AIClientError, asyncio.TimeoutError)):
+                logger.error("Error generating %s: %s", name, response)
+                sections.append(fallback)
+            elif isinstance(response, BaseException):
+                raise response
+            else:
+                sections.append(response.strip())
+        
+        return tuple(sections)
     
-    async def _generate_key_messaging(
-        self, 
-        concept: BusinessConcept, 
-        market_insights: MarketInsights
-    ) -> List[str]:
+    async def _generate_key_messaging(self, ctx: _PromptContext) -> List[str]:
         """Generate key marketing messages."""
         
-        messaging_prompt = f"""
-        Generate key marketing messages for this business concept:
-        
-        Business Concept: {concept.concept_description}
-        Product Features: {', '.join(concept.product_info.features) if concept.product_info.features else 'Not specified'}
-        Competitive Advantages: {', '.join(concept.competitive_advantages) if concept.competitive_advantages else 'Not specified'}
-        Target Audience: Age {concept.target_demographics.age_min}-{concept.target_demographics.age_max}, {concept.target_demographics.income_range}
-        
-        Create 5-7 key marketing messages that:
-        1. Highlight unique benefits
-        2. Address customer pain points
-        3. Emphasize value proposition
-        4. Resonate with target audience
-        5. Differentiate from competitors
-        
-        Format as short, punchy messages, one per line.
-        """
+        messaging_prompt = ctx.render("key_messaging")
         
         try:
-            response = await self.ai_client.generate_text(messaging_prompt, max_tokens=300)
-            messages = self._parse_list_response(response)
-            return messages[:7]
-        except Exception as e:
-            logger.error(f"Error generating key messaging: {str(e)}")
+            stream = self.ai_client.stream_text(messaging_prompt, max_tokens=300, template_id="key_messaging")
+            return await self._parse_list_stream(stream, 7)
+        except (AIClientError, asyncio.TimeoutError) as e:
+            logger.error("Error generating key messaging: %s", e)
             return ["Key messaging unavailable"]
     
     async def _generate_visual_identity_suggestions(
         self, 
-        concept: BusinessConcept, 
+        ctx: _PromptContext, 
         product_analysis: Optional[Dict[str, Any]]
     ) -> List[str]:
         """Generate visual identity suggestions."""
         
-        visual_prompt = f"""
-        Generate visual identity suggestions for this business concept:
-        
-        Business Concept: {concept.concept_description}
-        Product Category: {concept.product_info.category or 'General'}
-        Target Demographics: Age {concept.target_demographics.age_min}-{concept.target_demographics.age_max}, {concept.target_demographics.income_range}
-        Product Analysis: {product_analysis.get('ai_analysis', {}).get('design_quality', 'Not available') if product_analysis else 'Not available'}
-        
-        Suggest visual identity elements including:
-        1. Overall design style (modern, classic, minimalist, etc.)
-        2. Typography recommendations
-        3. Imagery style
-        4. Visual tone and mood
-        5. Brand personality expression
-        
-        Format as specific suggestions, one per line.
-        """
+        design_quality = 'Not available'
+        if product_analysis:
+            design_quality = product_analysis.get('ai_analysis', {}).get('design_quality', 'Not available')
+        visual_prompt = ctx.render("visual_identity", design_quality=design_quality)
         
         try:
-            response = await self.ai_client.generate_text(visual_prompt, max_tokens=250)
-            suggestions = self._parse_list_response(response)
-            return suggestions[:6]
-        except Exception as e:
-            logger.error(f"Error generating visual identity suggestions: {str(e)}")
+            stream = self.ai_client.stream_text(visual_prompt, max_tokens=250, template_id="visual_identity")
+            return await self._parse_list_stream(stream, 6)
+        except (AIClientError, asyncio.TimeoutError) as e:
+            logger.error("Error generating visual identity suggestions: %s", e)
             return ["Visual identity suggestions unavailable"]
     
-    async def _recommend_marketing_channels(
-        self, 
-        concept: BusinessConcept, 
-        market_insights: MarketInsights
-    ) -> List[str]:
+    async def _recommend_marketing_channels(self, ctx: _PromptContext) -> List[str]:
         """Recommend marketing channels."""
         
-        channels_prompt = f"""
-        Recommend marketing channels for this business concept:
-        
-        Business Concept: {concept.concept_description}
-        Target Demographics: Age {concept.target_demographics.age_min}-{concept.target_demographics.age_max}, {concept.target_demographics.income_range}, {concept.target_demographics.location}
-        Target Interests: {', '.join(concept.target_demographics.interests) if concept.target_demographics.interests else 'Not specified'}
-        Market Size: {market_insights.market_size}
-        Competition Level: {market_insights.competition_level}
-        
-        Recommend 5-7 marketing channels considering:
-        1. Target audience preferences
-        2. Budget efficiency
-        3. Market reach potential
-        4. Competition level
-        5. Local vs. digital opportunities
-        
-        Format as specific channels, one per line.
-        """
+        channels_prompt = ctx.render("marketing_channels")
         
         try:
-            response = await self.ai_client.generate_text(channels_prompt, max_tokens=200)
-            channels = self._parse_list_response(response)
-            return channels[:7]
-        except Exception as e:
-            logger.error(f"Error recommending marketing channels: {str(e)}")
+            stream = self.ai_client.stream_text(channels_prompt, max_tokens=200, template_id="marketing_channels")
+            return await self._parse_list_stream(stream, 7)
+        except (AIClientError, asyncio.TimeoutError) as e:
+            logger.error("Error recommending marketing channels: %s", e)
             return ["Marketing channel recommendations unavailable"]
     
-    async def _generate_content_strategy(
-        self, 
-        concept: BusinessConcept, 
-        market_insights: MarketInsights
-    ) -> str:
-        """Generate content marketing strategy."""
-        
-        content_prompt = f"""
-        Create a content marketing strategy for this business concept:
-        
-        Business Concept: {concept.concept_description}
-        Target Demographics: Age {concept.target_demographics.age_min}-{concept.target_demographics.age_max}, {concept.target_demographics.income_range}
-        Target Interests: {', '.join(concept.target_demographics.interests) if concept.target_demographics.interests else 'Not specified'}
-        Market Trends: {', '.join(market_insights.market_trends[:3])}
-        
-        Provide a content strategy covering:
-        1. Content themes and topics
-        2. Content formats and types
-        3. Publishing frequency and schedule
-        4. Audience engagement approach
-        5. Content distribution strategy
-        
-        Format as a comprehensive strategy (2-3 paragraphs).
-        """
-        
-        try:
-            response = await self.ai_client.generate_text(content_prompt, max_tokens=400)
-            return response.strip()
-        except Exception as e:
-            logger.error(f"Error generating content strategy: {str(e)}")
-            return "Content strategy unavailable"
-    
-    async def _generate_logo_concepts(self, concept: BusinessConcept) -> List[str]:
+    async def _generate_logo_concepts(self, ctx: _PromptContext) -> List[str]:
         """Generate logo concept ideas."""
         
-        logo_prompt = f"""
-        Generate logo concept ideas for this business:
-        
-        Business Concept: {concept.concept_description}
-        Product/Service: {concept.product_info.description or 'Not specified'}
-        Business Name: {concept.product_info.name or 'Not specified'}
-        
-        Create 5-6 logo concept ideas that:
-        1. Reflect the business nature
-        2. Appeal to target audience
-        3. Are memorable and distinctive
-        4. Work across different media
-        5. Convey brand personality
-        
-        Format as concept descriptions, one per line.
-        """
+        logo_prompt = ctx.render("logo_concepts")
         
         try:
-            response = await self.ai_client.generate_text(logo_prompt, max_tokens=250)
-            concepts = self._parse_list_response(response)
-            return concepts[:6]
-        except Exception as e:
-            logger.error(f"Error generating logo concepts: {str(e)}")
+            stream = self.ai_client.stream_text(logo_prompt, max_tokens=250, template_id="logo_concepts")
+            return await self._parse_list_stream(stream, 6)
+        except (AIClientError, asyncio.TimeoutError) as e:
+            logger.error("Error generating logo concepts: %s", e)
             return ["Logo concept ideas unavailable"]
     
-    def _generate_color_palette(self, concept: BusinessConcept) -> List[str]:
+    def _generate_color_palette(self, concept: BusinessConcept) -> Tuple[str, ...]:
         """Generate color palette based on business category."""
         
-        # Get category-specific palette
-        category = concept.product_info.category
-        if category and category.value in self.color_palettes:
-            base_palette = self.color_palettes[category.value]
-        else:
-            base_palette = self.color_palettes["default"]
+        # Category-specific palette plus complementary colors, up to 8
+        palette = _CATEGORY_PALETTES.get(concept.product_info.category)
+        if palette is None:
+            palette = _CATEGORY_PALETTES["default"]
         
-        # Add some variation to the base palette
-        palette = base_palette.copy()
-        
-        # Generate complementary colors
-        for color in base_palette[:2]:
-            try:
-                # Convert hex to RGB
-                rgb = tuple(int(color[i:i+2], 16) for i in (1, 3, 5))
-                # Convert to HSV
-                hsv = colorsys.rgb_to_hsv(rgb[0]/255, rgb[1]/255, rgb[2]/255)
-                # Create complementary color
-                comp_hsv = ((hsv[0] + 0.5) % 1.0, hsv[1], hsv[2])
-                comp_rgb = colorsys.hsv_to_rgb(*comp_hsv)
-                comp_hex = "#{:02x}{:02x}{:02x}".format(
-                    int(comp_rgb[0] * 255),
-                    int(comp_rgb[1] * 255),
-                    int(comp_rgb[2] * 255)
-                )
-                if comp_hex not in palette:
-                    palette.append(comp_hex)
-            except:
-                continue
-        
-        return palette[:8]  # Return up to 8 colors
+        return palette
     
     async def _generate_commercial_script(
         self, 
-        concept: BusinessConcept, 
+        ctx: _PromptContext, 
         brand_positioning: str
     ) -> str:
         """Generate a sample commercial script."""
         
-        script_prompt = f"""
-        Create a 30-second commercial script for this business:
-        
-        Business Concept: {concept.concept_description}
-        Product/Service: {concept.product_info.description or 'Not specified'}
-        Brand Positioning: {brand_positioning}
-        Target Audience: Age {concept.target_demographics.age_min}-{concept.target_demographics.age_max}, {concept.target_demographics.income_range}
-        
-        Create an engaging 30-second commercial script that:
-        1. Grabs attention in the first 5 seconds
-        2. Clearly communicates the value proposition
-        3. Includes a strong call to action
-        4. Resonates with the target audience
-        5. Reflects the brand positioning
-        
-        Format as a proper script with scene descriptions and dialogue.
-        """
+        script_prompt = ctx.render("commercial_script", brand_positioning=brand_positioning)
         
         try:
-            response = await self.ai_client.generate_text(script_prompt, max_tokens=400)
+            response = await self.ai_client.generate_text(script_prompt, max_tokens=400, template_id="commercial_script")
             return response.strip()
-        except Exception as e:
-            logger.error(f"Error generating commercial script: {str(e)}")
+        except (AIClientError, asyncio.TimeoutError) as e:
+            logger.error("Error generating commercial script: %s", e)
             return "Commercial script unavailable"
     
     def _parse_list_response(self, response: str) -> List[str]:
         """Parse list items from AI response."""
-        import re
+        # Remove bullet points, numbers, etc. and ignore very short items
+        return [
+            item for item in (
+                _LIST_PREFIX_RE.sub('', line).strip() for line in response.splitlines()
+            )
+            if len(item) > 3
+        ]
+    
+    async def _parse_list_stream(self, stream: AsyncIterator[str], limit: int) -> List[str]:
+        """Parse up to limit list items from a streamed AI response.
         
-        lines = response.strip().split('\n')
+        Items are parsed line by line as the text arrives, and the stream is
+        closed as soon as enough items have been collected.
+        """
         items = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Remove bullet points, numbers, etc.
-            line = re.sub(r'^[\d\.\-\*\+\s]+', '', line).strip()
-            
-            if line and len(line) > 3:  # Ignore very short items
-                items.append(line)
-        
-        return items
+        buffer = ""
+        try:
+            async for chunk in stream:
+                buffer += chunk
+                *lines, buffer = buffer.split('\n')
+                for line in lines:
+                    item = _LIST_PREFIX_RE.sub('', line).strip()
+                    if len(item) > 3:
+                        items.append(item)
+                        if len(items) >= limit:
+                            return items
+        finally:
+            await stream.aclose()
+        
+        # The final line has no trailing newline
+        items.extend(self._parse_list_response(buffer))
+        return items[:limit]
     
     async def generate_website_copy(self, concept: BusinessConcept, branding: BrandingRecommendations) -> Dict[str, str]:
         """Generate website copy sections."""
         
-        copy_prompt = f"""
-        Generate website copy for this business:
-        
-        Business Concept: {concept.concept_description}
-        Brand Positioning: {branding.brand_positioning}
-        Key Messages: {', '.join(branding.key_messaging[:3])}
-        
-        Create copy for:
-        1. Hero headline (compelling, benefit-focused)
-        2. About section (2-3 sentences)
-        3. Services/Products section (brief description)
-        4. Call-to-action text
-        
-        Format as:
-        HERO: [headline]
-        ABOUT: [about text]
-        SERVICES: [services text]
-        CTA: [call-to-action]
-        """
+        copy_prompt = _PROMPT_TEMPLATES["website_copy"].format(
+            concept_description=concept.concept_description,
+            brand_positioning=branding.brand_positioning,
+            key_messages=', '.join(branding.key_messaging[:3])
+        )
         
         try:
-            response = await self.ai_client.generate_text(copy_prompt, max_tokens=300)
-            
-            # Parse the response
-            copy_sections = {}
-            lines = response.split('\n')
-            current_section = None
+            response = await self.ai_client.generate_text(copy_prompt, max_tokens=300, template_id="website_copy")
             
-            for line in lines:
-                line = line.strip()
-                if line.startswith('HERO:'):
-                    copy_sections['hero'] = line.replace('HERO:', '').strip()
-                elif line.startswith('ABOUT:'):
-                    copy_sections['about'] = line.replace('ABOUT:', '').strip()
-                elif line.startswith('SERVICES:'):
-                    copy_sections['services'] = line.replace('SERVICES:', '').strip()
-                elif line.startswith('CTA:'):
-                    copy_sections['cta'] = line.replace('CTA:', '').strip()
+            copy_sections = {
+                match.group(1).lower(): match.group(2).strip()
+                for match in _COPY_LINE_RE.finditer(response)
+            }
             
-            return copy_sections
+            # Fill any section the AI left out
+            return {**_DEFAULT_WEBSITE_COPY, **copy_sections}
             
-        except Exception as e:
-            logger.error(f"Error generating website copy: {str(e)}")
-            return {
-                'hero': 'Transform Your Business Today',
-                'about': 'We provide innovative solutions for modern businesses.',
-                'services': 'Our comprehensive services are designed to meet your needs.',
-                'cta': 'Get Started Now'
-            }
\ No newline at end of file
+        except (AIClientError, asyncio.TimeoutError) as e:
+            logger.error("Error generating website copy: %s", e)
+            return dict(_DEFAULT_WEBSITE_COPY)
@@ -2,33 +2,147 @@
 
 import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Awaitable, Callable, Tuple
 import base64
 from io import BytesIO
 
-from ..core.config import config
+import numpy as np
+
+from ..core.config import PROVIDER_MODELS, get_config
+from ..core.cache import ResponseCache, SemanticCache
 
 logger = logging.getLogger(__name__)
 
 
+def _image_media_type(image_data: bytes) -> str:
+    """Detect the image media type from its leading magic bytes."""
+    if image_data[:8] == b'\x89PNG\r\n\x1a\n':
+        return "image/png"
+    if image_data[:6] in (b'GIF87a', b'GIF89a'):
+        return "image/gif"
+    if image_data[:4] == b'RIFF' and image_data[8:12] == b'WEBP':
+        return "image/webp"
+    # JPEG (FF D8 FF) and anything unrecognized
+    return "image/jpeg"
+
+
+# Bound (generate, stream) coroutine methods of one AI service
+_Handlers = Tuple[Callable[..., Awaitable[str]], Callable[..., AsyncIterator[str]]]
+
+# Default model for each service, in fallback order
+_FALLBACK_MODELS = (
+    ("openai", "gpt-3.5-turbo"),
+    ("anthropic", "claude-3-haiku-20240307"),
+    ("ollama", "llama2"),
+)
+
+
+class AIClientError(RuntimeError):
+    """Raised when no AI service can serve a request or a provider call fails."""
+
+
 class AIClient:
     """Unified client for different AI services."""
     
     def __init__(self):
         """Initialize AI client."""
+        config = get_config()
         self.openai_client = None
         self.anthropic_client = None
         self.ollama_client = None
+        # Caps in-flight provider requests so concurrent prompts stay
+        # within provider rate limits
+        self._semaphore = asyncio.Semaphore(config.get("ai.max_concurrency", 8))
+        self.response_cache = ResponseCache(
+            max_size=config.get("cache.max_size", 1000),
+            ttl=config.get("cache.ttl", 3600)
+        )
+        self.semantic_cache = None
+        if config.get("cache.semantic_enabled", False):
+            self.semantic_cache = SemanticCache(
+                similarity_threshold=config.get("cache.similarity_threshold", 0.92),
+                max_size=config.get("cache.max_size", 1000),
+                ttl=config.get("cache.ttl", 3600)
+            )
+        # Prompts waiting to be embedded together, and in-flight batch tasks
+        self._pending_embeddings: List[Tuple[str, asyncio.Future]] = []
+        self._embedding_tasks = set()
+        self._http_client = None
         self._initialize_clients()
+        self.refresh_config()
+    
+    def refresh_config(self):
+        """Re-read the per-request settings from the global configuration.
+        
+        These are resolved once rather than on every request; call this after
+        changing them at runtime.
+        """
+        config = get_config()
+        self._default_model = config.get("ai.default_model", "gpt-3.5-turbo")
+        self._use_local = bool(config.get("ai.use_local_models"))
+        self._cache_enabled = bool(config.get("cache.enabled", False))
+        self._embedding_backend = config.get("cache.embedding_backend", "local")
+        self._embedding_model = config.get("cache.embedding_model", "text-embedding-3-small")
+        
+        # Bound (generate, stream) methods for each available service
+        providers: Dict[str, _Handlers] = {}
+        if self.openai_client:
+            providers["openai"] = (self._generate_openai, self._stream_openai)
+        if self.anthropic_client:
+            providers["anthropic"] = (self._generate_anthropic, self._stream_anthropic)
+        if self.ollama_client:
+            providers["ollama"] = (self._generate_ollama, self._stream_ollama)
+        
+        # Model name prefixes (the part before the first "-") served directly
+        self._dispatch: Dict[str, _Handlers] = {}
+        if "openai" in providers:
+            self._dispatch["gpt"] = providers["openai"]
+        if "anthropic" in providers:
+            self._dispatch["claude"] = providers["anthropic"]
+        
+        # Any other model name is passed to Ollama as-is when local models are on
+        self._local_handlers = providers.get("ollama") if self._use_local else None
+        
+        # Otherwise fall back to the default model of the first available service
+        self._fallback: Tuple[Tuple[_Handlers, str], ...] = tuple(
+            (providers[name], default_model)
+            for name, default_model in _FALLBACK_MODELS
+            if name in providers
+        )
+    
+    def _get_http_client(self):
+        """Return the keep-alive HTTP connection pool shared by hosted providers."""
+        if self._http_client is None:
+            # httpx ships with the provider SDKs; HTTP/2 additionally needs h2
+            import httpx
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+            
+            self._http_client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=100,
+                    max_connections=200,
+                    keepalive_expiry=60
+                ),
+                timeout=httpx.Timeout(60.0)
+            )
+        return self._http_client
     
     def _initialize_clients(self):
         """Initialize available AI clients."""
+        config = get_config()
         # OpenAI client
         if config.get("ai.openai_api_key"):
             try:
                 import openai
                 self.openai_client = openai.AsyncOpenAI(
-                    api_key=config.get("ai.openai_api_key")
+                    api_key=config.get("ai.openai_api_key"),
+                    max_retries=config.get("ai.max_retries", 4),
+                    http_client=self._get_http_client()
                 )
                 logger.info("OpenAI client initialized")
             except ImportError:
@@ -39,7 +153,9 @@ class AIClient:
             try:
                 import anthropic
                 self.anthropic_client = anthropic.AsyncAnthropic(
-                    api_key=config.get("ai.anthropic_api_key")
+                    api_key=config.get("ai.anthropic_api_key"),
+                    max_retries=config.get("ai.max_retries", 4),
+                    http_client=self._get_http_client()
                 )
                 logger.info("Anthropic client initialized")
             except ImportError:
@@ -55,13 +171,28 @@ class AIClient:
                 logger.info("Ollama client initialized")
             except ImportError:
                 logger.warning("Ollama library not available")
+        
+        # Which services exist is fixed from here on
+        clients = (
+            ("openai", self.openai_client),
+            ("anthropic", self.anthropic_client),
+            ("ollama", self.ollama_client)
+        )
+        self._available_models: Tuple[str, ...] = tuple(
+            model
+            for name, client in clients if client
+            for model in PROVIDER_MODELS[name]
+        )
+        self._is_available = any(client for _, client in clients)
     
     async def generate_text(
         self, 
         prompt: str, 
         model: Optional[str] = None,
         max_tokens: int = 2000,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        template_id: Optional[str] = None,
+        json_mode: bool = False
     ) -> str:
         """
         Generate text using the best available AI service.
@@ -71,33 +202,239 @@ class AIClient:
             model: Specific model to use (optional)
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            template_id: Prompt template identifier used to scope semantic
+                cache matches (optional)
+            json_mode: Ask the service for a single JSON object; the prompt
+                should still describe the expected keys
             
         Returns:
             Generated text response
         """
-        model = model or config.get("ai.default_model", "gpt-3.5-turbo")
+        model = model or self._default_model
+        
+        # Deterministic requests are always safe to reuse; sampled ones only
+        # when caching has been explicitly enabled.
+        use_cache = temperature == 0 or self._cache_enabled
+        cache_key = None
+        if use_cache:
+            cache_key = ResponseCache.make_key(prompt, model, max_tokens, temperature, json_mode)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("AI response cache hit")
+                return cached
         
-        # Try OpenAI first
-        if self.openai_client and ("gpt" in model.lower() or model.startswith("gpt")):
-            return await self._generate_openai(prompt, model, max_tokens, temperature)
+        # Fall back to a near-duplicate prompt from the same template
+        embedding = None
+        if self.semantic_cache and template_id:
+            embedding = await self._embed_prompt(prompt)
+            if embedding is not None:
+                cached = self.semantic_cache.lookup(f"{model}:{template_id}", embedding)
+                if cached is not None:
+                    logger.debug("AI semantic cache hit for template %s", template_id)
+                    return cached
         
-        # Try Anthropic
-        if self.anthropic_client and "claude" in model.lower():
-            return await self._generate_anthropic(prompt, model, max_tokens, temperature)
+        async with self._semaphore:
+            response = await self._generate_uncached(prompt, model, max_tokens, temperature, json_mode)
         
-        # Try Ollama for local models
-        if self.ollama_client and config.get("ai.use_local_models"):
-            return await self._generate_ollama(prompt, model, max_tokens, temperature)
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response)
+        if embedding is not None:
+            self.semantic_cache.add(f"{model}:{template_id}", embedding, response)
+        
+        return response
+    
+    async def generate_text_batch(
+        self, 
+        prompts: List[str], 
+        max_tokens: Optional[List[int]] = None,
+        template_ids: Optional[List[Optional[str]]] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Generate text for several independent prompts in one call.
+        
+        Prompts are dispatched concurrently over the shared client
+        connections, so the batch takes roughly as long as its slowest
+        prompt. Each prompt still goes through the response caches and the
+        concurrency limit.
+        
+        Args:
+            prompts: Input prompts
+            max_tokens: Maximum tokens to generate for each prompt
+                (optional, 2000 each by default)
+            template_ids: Prompt template identifier for each prompt (optional)
+            model: Specific model to use (optional)
+            temperature: Sampling temperature
+            return_exceptions: Return failures in place of their responses
+                instead of raising the first one
+            
+        Returns:
+            Generated text responses in prompt order
+        """
+        max_tokens = max_tokens or [2000] * len(prompts)
+        template_ids = template_ids or [None] * len(prompts)
+        
+        return await asyncio.gather(
+            *(
+                self.generate_text(prompt, model, tokens, temperature, template_id)
+                for prompt, tokens, template_id in zip(prompts, max_tokens, template_ids)
+            ),
+            return_exceptions=return_exceptions
+        )
+    
+    async def stream_text(
+        self, 
+        prompt: str, 
+        model: Optional[str] = None,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+        template_id: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated text from the best available AI service.
+        
+        Chunks are yielded as the provider produces them. Closing the
+        generator early (e.g. with ``aclose()``) cancels the underlying
+        request, so callers that only need the start of a response do not
+        wait for the rest of it. Only fully received responses are cached.
+        
+        Args:
+            prompt: The input prompt
+            model: Specific model to use (optional)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            template_id: Prompt template identifier used to scope semantic
+                cache matches (optional)
+            
+        Yields:
+            Generated text chunks
+        """
+        model = model or self._default_model
+        
+        use_cache = temperature == 0 or self._cache_enabled
+        cache_key = None
+        if use_cache:
+            cache_key = ResponseCache.make_key(prompt, model, max_tokens, temperature)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("AI response cache hit")
+                yield cached
+                return
+        
+        embedding = None
+        if self.semantic_cache and template_id:
+            embedding = await self._embed_prompt(prompt)
+            if embedding is not None:
+                cached = self.semantic_cache.lookup(f"{model}:{template_id}", embedding)
+                if cached is not None:
+                    logger.debug("AI semantic cache hit for template %s", template_id)
+                    yield cached
+                    return
+        
+        (_, stream_fn), provider_model = self._select_provider(model)
+        
+        chunks = []
+        async with self._semaphore:
+            stream = stream_fn(prompt, provider_model, max_tokens, temperature)
+            try:
+                async for chunk in stream:
+                    chunks.append(chunk)
+                    yield chunk
+            finally:
+                # Close the provider stream right away when the consumer
+                # stops early instead of leaving it to the garbage collector
+                await stream.aclose()
+        
+        response = "".join(chunks)
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response)
+        if embedding is not None:
+            self.semantic_cache.add(f"{model}:{template_id}", embedding, response)
+    
+    def _select_provider(self, model: str) -> Tuple[_Handlers, str]:
+        """Pick the (generate, stream) handlers and model for a request."""
+        handlers = self._dispatch.get(model.split("-", 1)[0].lower())
+        if handlers:
+            return handlers, model
+        
+        if self._local_handlers:
+            return self._local_handlers, model
         
         # Fallback to any available service
-        if self.openai_client:
-            return await self._generate_openai(prompt, "gpt-3.5-turbo", max_tokens, temperature)
-        elif self.anthropic_client:
-            return await self._generate_anthropic(prompt, "claude-3-haiku-20240307", max_tokens, temperature)
-        elif self.ollama_client:
-            return await self._generate_ollama(prompt, "llama2", max_tokens, temperature)
+        if self._fallback:
+            return self._fallback[0]
         
-        raise RuntimeError("No AI service available. Please configure API keys or local models.")
+        raise AIClientError("No AI service available. Please configure API keys or local models.")
+    
+    async def _embed_prompt(self, prompt: str) -> Optional[np.ndarray]:
+        """Embed a prompt for the semantic cache, or return None if unavailable.
+        
+        Prompts submitted in the same event loop iteration, e.g. by requests
+        dispatched together with asyncio.gather, are embedded in one batch.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_embeddings.append((prompt, future))
+        if len(self._pending_embeddings) == 1:
+            # Let the other concurrently started requests join this batch
+            loop.call_soon(self._start_embedding_batch)
+        return await future
+    
+    def _start_embedding_batch(self):
+        """Embed every pending prompt in a background task."""
+        batch, self._pending_embeddings = self._pending_embeddings, []
+        task = asyncio.ensure_future(self._embed_batch(batch))
+        self._embedding_tasks.add(task)
+        task.add_done_callback(self._embedding_tasks.discard)
+    
+    async def _embed_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Embed a batch of prompts and resolve their waiting futures."""
+        try:
+            embeddings = await self._embed_texts([prompt for prompt, _ in batch])
+        except Exception as e:
+            # A failed embedding only skips the semantic cache, never the request
+            logger.warning("Prompt embedding failed, skipping semantic cache: %s", e)
+            embeddings = [None] * len(batch)
+        
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+    
+    async def _embed_texts(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Return normalized embeddings for texts, with None where unavailable."""
+        if self._embedding_backend == "openai" and self.openai_client:
+            try:
+                response = await self.openai_client.embeddings.create(
+                    model=self._embedding_model,
+                    input=texts
+                )
+            except Exception as e:
+                logger.warning("Prompt embedding failed, skipping semantic cache: %s", e)
+                return [None] * len(texts)
+            data = sorted(response.data, key=lambda item: item.index)
+            matrix = np.asarray([item.embedding for item in data], dtype=np.float32)
+        else:
+            # The local model is CPU-bound, so keep it off the event loop
+            matrix = await asyncio.to_thread(self.semantic_cache.embed_batch, texts)
+            if matrix is None:
+                return [None] * len(texts)
+        
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        return list(matrix)
+    
+    async def _generate_uncached(
+        self, 
+        prompt: str, 
+        model: str, 
+        max_tokens: int, 
+        temperature: float,
+        json_mode: bool = False
+    ) -> str:
+        """Route a generation request to the matching AI service."""
+        (generate, _), model = self._select_provider(model)
+        return await generate(prompt, model, max_tokens, temperature, json_mode)
     
     async def analyze_image(
         self, 
@@ -118,13 +455,18 @@ class AIClient:
         """
         model = model or "gpt-4-vision-preview"
         
-        # Convert image to base64
-        image_b64 = base64.b64encode(image_data).decode('utf-8')
+        media_type = _image_media_type(image_data)
         
+        # Base64-encode only for a vision provider, straight into the form
+        # each one expects
         if self.openai_client and "gpt" in model.lower():
-            return await self._analyze_image_openai(image_b64, prompt, model)
+            image_url = f"data:{media_type};base64,{base64.b64encode(image_data).decode('ascii')}"
+            async with self._semaphore:
+                return await self._analyze_image_openai(image_url, prompt, model)
         elif self.anthropic_client and "claude" in model.lower():
-            return await self._analyze_image_anthropic(image_b64, prompt, model)
+            image_b64 = base64.b64encode(image_data).decode('ascii')
+            async with self._semaphore:
+                return await self._analyze_image_anthropic(image_b64, media_type, prompt, model)
         
         # Fallback: describe image without vision model
         return await self.generate_text(
@@ -137,53 +479,64 @@ class AIClient:
         prompt: str, 
         model: str, 
         max_tokens: int, 
-        temperature: float
+        temperature: float,
+        json_mode: bool = False
     ) -> str:
         """Generate text using OpenAI."""
+        extra = {"response_format": {"type": "json_object"}} if json_mode else {}
         try:
             response = await self.openai_client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                **extra
             )
             return response.choices[0].message.content
         except Exception as e:
-            logger.error(f"OpenAI generation error: {str(e)}")
-            raise
+            logger.error("OpenAI generation error: %s", e)
+            raise AIClientError(f"OpenAI generation error: {e}") from e
     
     async def _generate_anthropic(
         self, 
         prompt: str, 
         model: str, 
         max_tokens: int, 
-        temperature: float
+        temperature: float,
+        json_mode: bool = False
     ) -> str:
         """Generate text using Anthropic."""
+        messages = [{"role": "user", "content": prompt}]
+        # There is no JSON mode; prefilling the opening brace has the same effect
+        prefill = "{" if json_mode else ""
+        if prefill:
+            messages.append({"role": "assistant", "content": prefill})
         try:
             response = await self.anthropic_client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                messages=[{"role": "user", "content": prompt}]
+                messages=messages
             )
-            return response.content[0].text
+            return prefill + response.content[0].text
         except Exception as e:
-            logger.error(f"Anthropic generation error: {str(e)}")
-            raise
+            logger.error("Anthropic generation error: %s", e)
+            raise AIClientError(f"Anthropic generation error: {e}") from e
     
     async def _generate_ollama(
         self, 
         prompt: str, 
         model: str, 
         max_tokens: int, 
-        temperature: float
+        temperature: float,
+        json_mode: bool = False
     ) -> str:
         """Generate text using Ollama."""
         try:
             response = await self.ollama_client.generate(
                 model=model,
                 prompt=prompt,
+                format="json" if json_mode else "",
                 options={
                     "num_predict": max_tokens,
                     "temperature": temperature
@@ -191,12 +544,88 @@ class AIClient:
             )
             return response['response']
         except Exception as e:
-            logger.error(f"Ollama generation error: {str(e)}")
-            raise
+            logger.error("Ollama generation error: %s", e)
+            raise AIClientError(f"Ollama generation error: {e}") from e
+    
+    async def _stream_openai(
+        self, 
+        prompt: str, 
+        model: str, 
+        max_tokens: int, 
+        temperature: float
+    ) -> AsyncIterator[str]:
+        """Stream text using OpenAI."""
+        try:
+            stream = await self.openai_client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+        except Exception as e:
+            logger.error("OpenAI generation error: %s", e)
+            raise AIClientError(f"OpenAI generation error: {e}") from e
+        
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            logger.error("OpenAI generation error: %s", e)
+            raise AIClientError(f"OpenAI generation error: {e}") from e
+        finally:
+            # Drops the HTTP connection if the consumer stopped early
+            await stream.response.aclose()
+    
+    async def _stream_anthropic(
+        self, 
+        prompt: str, 
+        model: str, 
+        max_tokens: int, 
+        temperature: float
+    ) -> AsyncIterator[str]:
+        """Stream text using Anthropic."""
+        try:
+            async with self.anthropic_client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+        except Exception as e:
+            logger.error("Anthropic generation error: %s", e)
+            raise AIClientError(f"Anthropic generation error: {e}") from e
+    
+    async def _stream_ollama(
+        self, 
+        prompt: str, 
+        model: str, 
+        max_tokens: int, 
+        temperature: float
+    ) -> AsyncIterator[str]:
+        """Stream text using Ollama."""
+        try:
+            stream = await self.ollama_client.generate(
+                model=model,
+                prompt=prompt,
+                options={
+                    "num_predict": max_tokens,
+                    "temperature": temperature
+                },
+                stream=True
+            )
+            async for part in stream:
+                yield part['response']
+        except Exception as e:
+            logger.error("Ollama generation error: %s", e)
+            raise AIClientError(f"Ollama generation error: {e}") from e
     
     async def _analyze_image_openai(
         self, 
-        image_b64: str, 
+        image_url: str, 
         prompt: str, 
         model: str
     ) -> str:
@@ -212,7 +641,7 @@ class AIClient:
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/jpeg;base64,{image_b64}"
+                                    "url": image_url
                                 }
                             }
                         ]
@@ -222,12 +651,13 @@ class AIClient:
             )
             return response.choices[0].message.content
         except Exception as e:
-            logger.error(f"OpenAI image analysis error: {str(e)}")
-            raise
+            logger.error("OpenAI image analysis error: %s", e)
+            raise AIClientError(f"OpenAI image analysis error: {e}") from e
     
     async def _analyze_image_anthropic(
         self, 
         image_b64: str, 
+        media_type: str, 
         prompt: str, 
         model: str
     ) -> str:
@@ -244,7 +674,7 @@ class AIClient:
                                 "type": "image",
                                 "source": {
                                     "type": "base64",
-                                    "media_type": "image/jpeg",
+                                    "media_type": media_type,
                                     "data": image_b64
                                 }
                             },
@@ -255,30 +685,23 @@ class AIClient:
             )
             return response.content[0].text
         except Exception as e:
-            logger.error(f"Anthropic image analysis error: {str(e)}")
-            raise
+            logger.error("Anthropic image analysis error: %s", e)
+            raise AIClientError(f"Anthropic image analysis error: {e}") from e
+    
+    async def close(self):
+        """Close the underlying AI service clients and their connection pools."""
+        for client in (self.openai_client, self.anthropic_client, self.ollama_client):
+            close = getattr(client, "close", None)
+            if close is not None:
+                await close()
+        
+        if self._http_client is not None:
+            await self._http_client.aclose()
     
     def get_available_models(self) -> List[str]:
         """Get list of available models."""
-        models = []
-        
-        if self.openai_client:
-            models.extend([
-                "gpt-4", "gpt-4-turbo", "gpt-3.5-turbo", "gpt-4-vision-preview"
-            ])
-        
-        if self.anthropic_client:
-            models.extend([
-                "claude-3-opus-20240229",
-                "claude-3-sonnet-20240229", 
-                "claude-3-haiku-20240307"
-            ])
-        
-        if self.ollama_client:
-            models.extend(["llama2", "mistral", "codellama"])
-        
-        return models
+        return list(self._available_models)
     
     def is_available(self) -> bool:
         """Check if any AI service is available."""
-        return bool(self.openai_client or self.anthropic_client or self.ollama_client)
\ No newline at end of file
+        return self._is_available
\ No newline at end of file
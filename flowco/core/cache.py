@@ -0,0 +1,177 @@
+"""Response caching for AI generation requests."""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ResponseCache:
+    """In-process LRU cache for AI responses with per-entry expiry."""
+
+    def __init__(self, max_size: int = 1000, ttl: float = 3600):
+        """Initialize response cache.
+
+        Args:
+            max_size: Maximum number of cached responses
+            ttl: Time-to-live for cached responses in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        json_mode: bool = False
+    ) -> str:
+        """Build a stable cache key for a generation request."""
+        request = {
+            "prompt": prompt,
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "json_mode": json_mode
+        }
+        if orjson is not None:
+            payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+        else:
+            payload = json.dumps(request, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: str):
+        """Store a response, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticCache:
+    """Similarity-based cache for AI responses to near-identical prompts.
+    
+    Prompts are embedded (locally with a small sentence-transformers model
+    by default) and compared by cosine similarity. Entries are partitioned by
+    a prompt template id so prompts built from different templates never
+    match, and expire after the configured time-to-live.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        max_size: int = 1000,
+        model_name: str = "all-MiniLM-L6-v2",
+        ttl: float = 3600
+    ):
+        """Initialize semantic cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a cache hit
+            max_size: Maximum number of cached responses per template
+            model_name: sentence-transformers model used for local embeddings
+            ttl: Time-to-live for cached responses in seconds
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_size = max_size
+        self.model_name = model_name
+        self.ttl = ttl
+        self._model = None
+        self._available = True
+        self._embeddings: Dict[str, np.ndarray] = {}
+        self._expires: Dict[str, np.ndarray] = {}
+        self._responses: Dict[str, List[str]] = {}
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """Return the normalized embedding for text, or None if unavailable."""
+        embeddings = self.embed_batch([text])
+        return None if embeddings is None else embeddings[0]
+
+    def embed_batch(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Return normalized embeddings for texts as rows, or None if unavailable."""
+        if not self._available:
+            return None
+
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._model = SentenceTransformer(self.model_name)
+            except ImportError:
+                logger.warning("sentence-transformers not available, semantic cache disabled")
+                self._available = False
+                return None
+
+        return self._model.encode(texts, normalize_embeddings=True).astype(np.float32)
+
+    def lookup(self, template_id: str, embedding: np.ndarray) -> Optional[str]:
+        """Return the most similar unexpired cached response above the threshold."""
+        matrix = self._embeddings.get(template_id)
+        if matrix is None:
+            return None
+
+        # Embeddings are normalized, so the inner product is the cosine similarity
+        similarities = matrix @ embedding
+        similarities[self._expires[template_id] < time.monotonic()] = -np.inf
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.similarity_threshold:
+            return self._responses[template_id][best]
+
+        return None
+
+    def add(self, template_id: str, embedding: np.ndarray, response: str):
+        """Store a response, dropping the oldest entries once full."""
+        expires_at = time.monotonic() + self.ttl
+        matrix = self._embeddings.get(template_id)
+        if matrix is None:
+            matrix = embedding[np.newaxis, :]
+            expires = np.array([expires_at])
+            responses = [response]
+        else:
+            matrix = np.vstack([matrix, embedding])
+            expires = np.append(self._expires[template_id], expires_at)
+            responses = self._responses[template_id] + [response]
+
+        self._embeddings[template_id] = matrix[-self.max_size:]
+        self._expires[template_id] = expires[-self.max_size:]
+        self._responses[template_id] = responses[-self.max_size:]
+
+    def clear(self):
+        """Remove all cached responses."""
+        self._embeddings.clear()
+        self._expires.clear()
+        self._responses.clear()
@@ -1,11 +1,35 @@
 """Configuration management for FlowCo."""
 
+import json
 import os
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Models offered by each AI service
+PROVIDER_MODELS: Dict[str, Tuple[str, ...]] = {
+    "openai": ("gpt-4", "gpt-4-turbo", "gpt-3.5-turbo", "gpt-4-vision-preview"),
+    "anthropic": (
+        "claude-3-opus-20240229",
+        "claude-3-sonnet-20240229",
+        "claude-3-haiku-20240307"
+    ),
+    "ollama": ("llama2", "mistral", "codellama"),
+}
+
+# The libyaml-backed loader is several times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Config:
     """Configuration manager for FlowCo system."""
@@ -18,12 +42,15 @@ class Config:
         """
         self.config_path = config_path
         self._config = {}
+        # Flat "a.b.c" -> value mirror of _config, rebuilt whenever it changes
+        self._flat: Dict[str, Any] = {}
         self._load_config()
     
     def _load_config(self):
         """Load configuration from environment and files."""
-        # Load environment variables
-        load_dotenv()
+        # Load environment variables, unless the environment is already populated
+        if os.getenv("FLOWCO_SKIP_DOTENV") != "1":
+            load_dotenv()
         
         # Default configuration
         self._config = {
@@ -33,6 +60,8 @@ class Config:
                 "default_model": os.getenv("DEFAULT_AI_MODEL", "gpt-3.5-turbo"),
                 "use_local_models": os.getenv("USE_LOCAL_MODELS", "false").lower() == "true",
                 "ollama_base_url": os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+                "max_concurrency": int(os.getenv("AI_MAX_CONCURRENCY", "8")),
+                "max_retries": int(os.getenv("AI_MAX_RETRIES", "4")),
             },
             "database": {
                 "path": os.getenv("DATABASE_PATH", "data/flowco.db"),
@@ -49,25 +78,66 @@ class Config:
             "research": {
                 "enable_web_scraping": os.getenv("ENABLE_WEB_SCRAPING", "true").lower() == "true",
                 "max_search_results": int(os.getenv("MAX_SEARCH_RESULTS", "10")),
+            },
+            "engine": {
+                "kill_threshold": float(os.getenv("ENGINE_KILL_THRESHOLD", "10")),
+                "early_branding": os.getenv("ENGINE_EARLY_BRANDING", "false").lower() == "true",
+            },
+            "cache": {
+                "enabled": os.getenv("CACHE_ENABLED", "false").lower() == "true",
+                "ttl": int(os.getenv("CACHE_TTL", "3600")),  # 1 hour
+                "max_size": int(os.getenv("CACHE_MAX_SIZE", "1000")),
+                "semantic_enabled": os.getenv("CACHE_SEMANTIC_ENABLED", "false").lower() == "true",
+                "similarity_threshold": float(os.getenv("CACHE_SIMILARITY_THRESHOLD", "0.92")),
+                "embedding_backend": os.getenv("CACHE_EMBEDDING_BACKEND", "local"),  # local or openai
+                "embedding_model": os.getenv("CACHE_EMBEDDING_MODEL", "text-embedding-3-small"),
             }
         }
+        self._rebuild_flat()
         
         # Load from config file if provided
         if self.config_path and Path(self.config_path).exists():
             with open(self.config_path, 'r') as f:
-                file_config = yaml.safe_load(f)
+                file_config = yaml.load(f, Loader=_YamlLoader)
                 self._merge_config(file_config)
     
     def _merge_config(self, new_config: Dict[str, Any]):
         """Merge new configuration with existing."""
-        def merge_dict(base: dict, new: dict):
+        stack = [(self._config, new_config, "")]
+        while stack:
+            base, new, prefix = stack.pop()
             for key, value in new.items():
-                if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                    merge_dict(base[key], value)
-                else:
-                    base[key] = value
-        
-        merge_dict(self._config, new_config)
+                dotted = f"{prefix}{key}"
+                current = base.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value, f"{dotted}."))
+                    continue
+                
+                # Keep the flat table in step instead of rebuilding it
+                if isinstance(current, dict):
+                    stale = f"{dotted}."
+                    for flat_key in [k for k in self._flat if k.startswith(stale)]:
+                        del self._flat[flat_key]
+                base[key] = value
+                self._flat[dotted] = value
+                if isinstance(value, dict):
+                    self._flatten_into(f"{dotted}.", value)
+    
+    def _rebuild_flat(self):
+        """Rebuild the flat dotted-key table from the nested config."""
+        self._flat = {}
+        self._flatten_into("", self._config)
+    
+    def _flatten_into(self, prefix: str, node: Dict[str, Any]):
+        """Add every key under node to the flat table, prefixed with prefix."""
+        stack = [(prefix, node)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                dotted = f"{prefix}{key}"
+                self._flat[dotted] = value
+                if isinstance(value, dict):
+                    stack.append((f"{dotted}.", value))
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation.
@@ -79,16 +149,7 @@ class Config:
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any):
         """Set configuration value using dot notation.
@@ -106,6 +167,7 @@ class Config:
             config = config[k]
         
         config[keys[-1]] = value
+        self._rebuild_flat()
     
     def has_ai_key(self) -> bool:
         """Check if any AI API key is configured."""
@@ -120,22 +182,13 @@ class Config:
         models = []
         
         if self.get("ai.openai_api_key"):
-            models.extend([
-                "gpt-4", "gpt-4-turbo", "gpt-3.5-turbo",
-                "gpt-4-vision-preview"
-            ])
+            models.extend(PROVIDER_MODELS["openai"])
         
         if self.get("ai.anthropic_api_key"):
-            models.extend([
-                "claude-3-opus-20240229",
-                "claude-3-sonnet-20240229",
-                "claude-3-haiku-20240307"
-            ])
+            models.extend(PROVIDER_MODELS["anthropic"])
         
         if self.get("ai.use_local_models"):
-            models.extend([
-                "llama2", "mistral", "codellama"
-            ])
+            models.extend(PROVIDER_MODELS["ollama"])
         
         return models
     
@@ -143,13 +196,34 @@ class Config:
         """Save current configuration to file.
         
         Args:
-            path: Path to save configuration (optional)
+            path: Path to save configuration (optional); a .json path is
+                written as JSON, anything else as YAML
         """
         save_path = path or self.config_path or "config.yaml"
         
+        # JSON is a subset of YAML, so a .json config loads back the same way
+        if Path(save_path).suffix.lower() == ".json":
+            if orjson is not None:
+                with open(save_path, 'wb') as f:
+                    f.write(orjson.dumps(self._config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(save_path, 'w') as f:
+                    json.dump(self._config, f, indent=2)
+            return
+        
         with open(save_path, 'w') as f:
             yaml.dump(self._config, f, default_flow_style=False)
 
 
-# Global configuration instance
-config = Config()
\ No newline at end of file
+@lru_cache()
+def get_config() -> Config:
+    """Return the global configuration instance, creating it on first use."""
+    return Config()
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `from flowco.core.config import config` working without building
+    # the global instance at import time
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
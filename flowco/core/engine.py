@@ -1,32 +1,221 @@
 """Core business evaluation engine."""
 
 import asyncio
+import json
+from dataclasses import dataclass
 from typing import Optional, Dict, Any
 import logging
 from datetime import datetime
 
 from ..models.business import BusinessConcept
-from ..models.evaluation import EvaluationResult, MarketInsights, BrandingRecommendations
+from ..models.evaluation import (
+    EvaluationResult, MarketInsights, BrandingRecommendations,
+    CompetitiveAnalysis, RiskAssessment
+)
 from ..processing.input_processor import InputProcessor
 from ..processing.vision_processor import VisionProcessor
 from ..research.market_analyzer import MarketAnalyzer
 from ..branding.content_generator import ContentGenerator
-from ..core.ai_client import AIClient
-from ..core.config import config
+from ..core.ai_client import AIClient, AIClientError
+from ..core.config import get_config
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sampling temperatures for the first scoring attempt and its retry
+_SCORING_TEMPERATURES = (0.7, 0.0)
+
+_REQUIRED_SCORES = (
+    "market_demand_score", "concept_viability_score",
+    "execution_difficulty_score", "overall_success_score", "confidence_level"
+)
+
+
+@dataclass(slots=True, frozen=True)
+class Scores:
+    """Core evaluation scores (0-100)."""
+    
+    market_demand_score: float
+    concept_viability_score: float
+    execution_difficulty_score: float
+    overall_success_score: float
+    confidence_level: float
+
+
+# Scores used when the AI scoring step fails
+_DEFAULT_SCORES = Scores(
+    market_demand_score=50.0,
+    concept_viability_score=50.0,
+    execution_difficulty_score=50.0,
+    overall_success_score=50.0,
+    confidence_level=25.0
+)
+
+
+@dataclass(slots=True, frozen=True)
+class _ScoringContext:
+    """Prompt fields for the scoring prompt."""
+    
+    concept: str
+    age_min: int
+    age_max: int
+    income: str
+    location: str
+    interests: str
+    competition_level: str
+    demographic_fit: float
+    location_demand: float
+    trends: str
+    product_description: str
+    product_features: str
+    product_analysis: str
+    
+    @classmethod
+    def build(
+        cls,
+        concept: BusinessConcept,
+        market_insights: MarketInsights,
+        product_analysis: Optional[Dict[str, Any]] = None
+    ) -> "_ScoringContext":
+        """Derive the scoring prompt fields from a concept and its market insights."""
+        demographics = concept.target_demographics
+        product_info = concept.product_info
+        ai_analysis = product_analysis.get("ai_analysis") if product_analysis else None
+        
+        return cls(
+            concept=concept.concept_description,
+            age_min=demographics.age_min,
+            age_max=demographics.age_max,
+            income=f"{demographics.income_range}",
+            location=demographics.location,
+            interests=', '.join(demographics.interests) or 'Not specified',
+            competition_level=market_insights.competition_level,
+            demographic_fit=market_insights.demographic_fit_score,
+            location_demand=market_insights.location_demand_score,
+            trends=', '.join(market_insights.market_trends) or 'Not specified',
+            product_description=product_info.description or 'Not specified',
+            product_features=', '.join(product_info.features) or 'Not specified',
+            product_analysis=f"{ai_analysis}" if ai_analysis else 'Not available'
+        )
+
+
+# Prompt templates for the engine's own AI steps
+_SCORING_PROMPT = """\
+Analyze the following business concept and provide numerical scores (0-100) for each category:
+
+Business Concept: {ctx.concept}
+Target Demographics: Age {ctx.age_min}-{ctx.age_max}, {ctx.income}, {ctx.location}
+Target Interests: {ctx.interests}
+Competition Level: {ctx.competition_level}
+Demographic Fit Score: {ctx.demographic_fit:.0f}/100
+Location Demand Score: {ctx.location_demand:.0f}/100
+Market Trends: {ctx.trends}
+Product Description: {ctx.product_description}
+Product Features: {ctx.product_features}
+Product Image Analysis: {ctx.product_analysis}
+
+Please provide scores for:
+1. Market Demand Score (0-100): How much demand exists for this product/service
+2. Concept Viability Score (0-100): How viable and realistic the concept is
+3. Execution Difficulty Score (0-100): How difficult it would be to execute (higher = more difficult)
+4. Overall Success Score (0-100): Overall probability of business success
+
+Consider factors like:
+- Market size and growth potential
+- Competition level and market saturation
+- Target demographic alignment
+- Product-market fit
+- Execution complexity and resource requirements
+- Geographic market conditions
+- Current trends and timing
+
+Respond with a single JSON object with keys market_demand_score,
+concept_viability_score, execution_difficulty_score, overall_success_score
+and confidence_level, each a number from 0 to 100.
+"""
+
+_RISK_PROMPT = """\
+Analyze the risks for this business concept:
+
+Concept: {concept}
+Market Competition: {competition_level}
+Target Market: {location}
+
+Identify and categorize risks as high, medium, or low priority.
+Also suggest mitigation strategies and critical success factors.
+"""
+
+_SUMMARY_PROMPT = """\
+Create an executive summary and recommendations for this business evaluation:
+
+Business Concept: {concept}
+Overall Success Score: {overall_success_score:.1f}/100
+Market Demand Score: {market_demand_score:.1f}/100
+Competition Level: {competition_level}
+Target Demographics: {demographics}
+
+Provide:
+1. A concise executive summary (2-3 paragraphs)
+2. 5-7 key recommendations
+3. 5-7 immediate next steps
+"""
+
+
+def _parse_scores(response: str) -> Dict[str, float]:
+    """Return the numeric scores in a JSON scoring response, which may be incomplete."""
+    try:
+        data = orjson.loads(response) if orjson is not None else json.loads(response)
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    
+    return {
+        key: float(data[key])
+        for key in _REQUIRED_SCORES
+        if isinstance(data.get(key), (int, float)) and not isinstance(data[key], bool)
+    }
+
+
+def _clamp_scores(scores: Dict[str, float]) -> Scores:
+    """Clamp the required scores to the valid 0-100 range, warning once if any were out of range."""
+    clamped = {key: max(0.0, min(100.0, scores[key])) for key in _REQUIRED_SCORES}
+    if any(clamped[key] != scores[key] for key in _REQUIRED_SCORES):
+        logger.warning(f"Invalid scores {scores}. Clamped to valid range.")
+    return Scores(**clamped)
+
+
+def _not_requested() -> asyncio.Future:
+    """Placeholder for optional evaluation steps that were not requested.
+    
+    The future is already resolved, so gathering it does not schedule a task.
+    """
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(None)
+    return future
+
 
 class BusinessEvaluationEngine:
     """Main engine for business concept evaluation."""
     
     def __init__(self):
         """Initialize the evaluation engine."""
+        # Components share one AI client so they reuse its provider
+        # connection pools and response caches
         self.ai_client = AIClient()
         self.input_processor = InputProcessor()
-        self.vision_processor = VisionProcessor()
-        self.market_analyzer = MarketAnalyzer()
-        self.content_generator = ContentGenerator()
+        self.vision_processor = VisionProcessor(self.ai_client)
+        self.market_analyzer = MarketAnalyzer(self.ai_client)
+        self.content_generator = ContentGenerator(self.ai_client)
+        # Concepts scoring below this skip branding and financial projections
+        self.kill_threshold = get_config().get("engine.kill_threshold", 10.0)
+        # Start branding alongside scoring, paying for its LLM calls even on
+        # concepts that are then killed, in exchange for lower latency
+        self.early_branding = get_config().get("engine.early_branding", False)
         
     async def evaluate_business_concept(
         self, 
@@ -63,42 +252,88 @@ class BusinessEvaluationEngine:
                 processed_concept, product_analysis
             )
             
-            # Step 4: Calculate core scores
-            scores = await self._calculate_core_scores(processed_concept, market_insights, product_analysis)
-            
-            # Step 5: Generate branding recommendations (if requested)
-            branding_recommendations = None
-            if include_branding:
-                branding_recommendations = await self.content_generator.generate_branding_recommendations(
-                    processed_concept, market_insights, product_analysis
+            # Branding only depends on the market research. By default it
+            # waits for the scores so killed concepts never pay for it; with
+            # early branding it starts alongside scoring instead and is
+            # cancelled if the concept scores too low.
+            branding_task = None
+            if include_branding and self.early_branding:
+                branding_task = asyncio.ensure_future(
+                    self.content_generator.generate_branding_recommendations(
+                        processed_concept, market_insights, product_analysis
+                    )
                 )
             
-            # Step 6: Perform competitive analysis
-            competitive_analysis = await self.market_analyzer.analyze_competition(
-                processed_concept, market_insights
-            )
-            
-            # Step 7: Generate financial projections (if requested)
-            financial_projections = None
-            if include_financial:
-                financial_projections = await self._generate_financial_projections(
-                    processed_concept, market_insights, scores
+            try:
+                # Steps 4-6: Score the concept, analyze competitors and assess
+                # risks; these only depend on the market research
+                scores, competitive_analysis, risk_assessment = await asyncio.gather(
+                    self._calculate_core_scores(processed_concept, market_insights, product_analysis),
+                    self.market_analyzer.analyze_competition(processed_concept, market_insights),
+                    self._assess_risks(processed_concept, market_insights),
+                    return_exceptions=True
                 )
+                
+                if isinstance(scores, Exception):
+                    logger.error(f"Error calculating scores: {str(scores)}")
+                    scores = _DEFAULT_SCORES
+                if isinstance(competitive_analysis, Exception):
+                    logger.error(f"Error analyzing competition: {str(competitive_analysis)}")
+                    competitive_analysis = CompetitiveAnalysis()
+                if isinstance(risk_assessment, Exception):
+                    logger.error(f"Error assessing risks: {str(risk_assessment)}")
+                    risk_assessment = RiskAssessment()
+                
+                # Branding and financials are not worth generating for a
+                # concept that is very unlikely to succeed
+                skip_optional = scores.overall_success_score < self.kill_threshold
+                if skip_optional:
+                    logger.info(
+                        f"Overall success score {scores.overall_success_score:.1f} is below "
+                        f"{self.kill_threshold:.1f}, skipping branding and financial projections"
+                    )
+                    if branding_task is not None:
+                        branding_task.cancel()
+                elif include_branding and branding_task is None:
+                    branding_task = asyncio.ensure_future(
+                        self.content_generator.generate_branding_recommendations(
+                            processed_concept, market_insights, product_analysis
+                        )
+                    )
+                
+                # Steps 7-9: Branding, financial projections and the executive
+                # summary (if requested)
+                branding_recommendations, financial_projections, summary = await asyncio.gather(
+                    branding_task if branding_task is not None and not skip_optional else _not_requested(),
+                    self._generate_financial_projections(
+                        processed_concept, market_insights, scores
+                    ) if include_financial and not skip_optional else _not_requested(),
+                    self._generate_summary_and_recommendations(
+                        processed_concept, scores, market_insights, competitive_analysis
+                    ),
+                    return_exceptions=True
+                )
+            finally:
+                if branding_task is not None and not branding_task.done():
+                    branding_task.cancel()
             
-            # Step 8: Assess risks
-            risk_assessment = await self._assess_risks(processed_concept, market_insights, scores)
-            
-            # Step 9: Generate executive summary and recommendations
-            executive_summary, recommendations, next_steps = await self._generate_summary_and_recommendations(
-                processed_concept, scores, market_insights, competitive_analysis
-            )
+            if isinstance(branding_recommendations, Exception):
+                logger.error(f"Error generating branding recommendations: {str(branding_recommendations)}")
+                branding_recommendations = None
+            if isinstance(financial_projections, Exception):
+                logger.error(f"Error generating financial projections: {str(financial_projections)}")
+                financial_projections = None
+            if isinstance(summary, Exception):
+                logger.error(f"Error generating summary: {str(summary)}")
+                summary = ("Summary not available", [], [])
+            executive_summary, recommendations, next_steps = summary
             
             # Step 10: Compile final result
             evaluation_result = EvaluationResult(
-                overall_success_score=scores["overall_success_score"],
-                market_demand_score=scores["market_demand_score"],
-                concept_viability_score=scores["concept_viability_score"],
-                execution_difficulty_score=scores["execution_difficulty_score"],
+                overall_success_score=scores.overall_success_score,
+                market_demand_score=scores.market_demand_score,
+                concept_viability_score=scores.concept_viability_score,
+                execution_difficulty_score=scores.execution_difficulty_score,
                 market_insights=market_insights,
                 branding_recommendations=branding_recommendations or BrandingRecommendations(
                     brand_positioning="Not generated",
@@ -110,10 +345,10 @@ class BusinessEvaluationEngine:
                 executive_summary=executive_summary,
                 key_recommendations=recommendations,
                 next_steps=next_steps,
-                confidence_level=scores.get("confidence_level", 75.0)
+                confidence_level=scores.confidence_level
             )
             
-            logger.info(f"Evaluation completed. Overall success score: {scores['overall_success_score']:.1f}")
+            logger.info(f"Evaluation completed. Overall success score: {scores.overall_success_score:.1f}")
             return evaluation_result
             
         except Exception as e:
@@ -125,117 +360,40 @@ class BusinessEvaluationEngine:
         concept: BusinessConcept, 
         market_insights: MarketInsights,
         product_analysis: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, float]:
+    ) -> Scores:
         """Calculate core evaluation scores."""
         
-        # Prepare context for AI scoring
-        context = {
-            "concept": concept.concept_description,
-            "demographics": {
-                "age_range": f"{concept.target_demographics.age_min}-{concept.target_demographics.age_max}",
-                "income": concept.target_demographics.income_range,
-                "location": concept.target_demographics.location,
-                "interests": concept.target_demographics.interests
-            },
-            "market_insights": {
-                "competition_level": market_insights.competition_level,
-                "demographic_fit": market_insights.demographic_fit_score,
-                "location_demand": market_insights.location_demand_score,
-                "trends": market_insights.market_trends
-            },
-            "product": {
-                "description": concept.product_info.description,
-                "features": concept.product_info.features,
-                "analysis": product_analysis
-            }
-        }
-        
-        scoring_prompt = f"""
-        Analyze the following business concept and provide numerical scores (0-100) for each category:
-
-        Business Concept: {context['concept']}
-        Target Demographics: {context['demographics']}
-        Market Context: {context['market_insights']}
-        Product Information: {context['product']}
-
-        Please provide scores for:
-        1. Market Demand Score (0-100): How much demand exists for this product/service
-        2. Concept Viability Score (0-100): How viable and realistic the concept is
-        3. Execution Difficulty Score (0-100): How difficult it would be to execute (higher = more difficult)
-        4. Overall Success Score (0-100): Overall probability of business success
-
-        Consider factors like:
-        - Market size and growth potential
-        - Competition level and market saturation
-        - Target demographic alignment
-        - Product-market fit
-        - Execution complexity and resource requirements
-        - Geographic market conditions
-        - Current trends and timing
-
-        Respond with only the numerical scores in this format:
-        Market Demand Score: XX
-        Concept Viability Score: XX
-        Execution Difficulty Score: XX
-        Overall Success Score: XX
-        Confidence Level: XX
-        """
+        ctx = _ScoringContext.build(concept, market_insights, product_analysis)
+        scoring_prompt = _SCORING_PROMPT.format(ctx=ctx)
         
         try:
-            response = await self.ai_client.generate_text(scoring_prompt)
-            scores = self._parse_scores(response)
-            
-            # Validate and adjust scores if needed
-            for key, value in scores.items():
-                if not 0 <= value <= 100:
-                    logger.warning(f"Invalid score for {key}: {value}. Clamping to valid range.")
-                    scores[key] = max(0, min(100, value))
-            
-            return scores
-            
-        except Exception as e:
+            # A malformed response is retried once at a lower temperature.
+            # Scores are specific to this concept, so they stay out of the
+            # semantic cache; the exact cache keys on temperature.
+            for temperature in _SCORING_TEMPERATURES:
+                response = await self.ai_client.generate_text(
+                    scoring_prompt,
+                    max_tokens=200,
+                    temperature=temperature,
+                    json_mode=True
+                )
+                scores = _parse_scores(response)
+                if all(key in scores for key in _REQUIRED_SCORES):
+                    break
+                logger.warning(f"Incomplete scores at temperature {temperature}: {scores}")
+        except (AIClientError, asyncio.TimeoutError) as e:
             logger.error(f"Error calculating scores: {str(e)}")
             # Return default scores if AI fails
-            return {
-                "market_demand_score": 50.0,
-                "concept_viability_score": 50.0,
-                "execution_difficulty_score": 50.0,
-                "overall_success_score": 50.0,
-                "confidence_level": 25.0
-            }
-    
-    def _parse_scores(self, response: str) -> Dict[str, float]:
-        """Parse scores from AI response."""
-        scores = {}
-        lines = response.strip().split('\n')
+            return _DEFAULT_SCORES
         
-        for line in lines:
-            if ':' in line:
-                key, value = line.split(':', 1)
-                key = key.strip().lower().replace(' ', '_')
-                try:
-                    score = float(value.strip())
-                    scores[key] = score
-                except ValueError:
-                    continue
-        
-        # Ensure all required scores are present
-        required_scores = [
-            "market_demand_score", "concept_viability_score", 
-            "execution_difficulty_score", "overall_success_score", "confidence_level"
-        ]
-        
-        for score_key in required_scores:
-            if score_key not in scores:
-                scores[score_key] = 50.0  # Default score
-        
-        return scores
+        # Fill any score still missing after the retry with the neutral default
+        return _clamp_scores({**{key: 50.0 for key in _REQUIRED_SCORES}, **scores})
     
     async def _generate_financial_projections(
         self, 
         concept: BusinessConcept, 
         market_insights: MarketInsights,
-        scores: Dict[str, float]
+        scores: Scores
     ):
         """Generate financial projections."""
         # This would be implemented with more sophisticated financial modeling
@@ -257,23 +415,16 @@ class BusinessEvaluationEngine:
     async def _assess_risks(
         self, 
         concept: BusinessConcept, 
-        market_insights: MarketInsights,
-        scores: Dict[str, float]
+        market_insights: MarketInsights
     ):
         """Assess business risks."""
-        from ..models.evaluation import RiskAssessment
         
         # Generate risk assessment using AI
-        risk_prompt = f"""
-        Analyze the risks for this business concept:
-        
-        Concept: {concept.concept_description}
-        Market Competition: {market_insights.competition_level}
-        Target Market: {concept.target_demographics.location}
-        
-        Identify and categorize risks as high, medium, or low priority.
-        Also suggest mitigation strategies and critical success factors.
-        """
+        risk_prompt = _RISK_PROMPT.format(
+            concept=concept.concept_description,
+            competition_level=market_insights.competition_level,
+            location=concept.target_demographics.location
+        )
         
         try:
             response = await self.ai_client.generate_text(risk_prompt)
@@ -296,33 +447,36 @@ class BusinessEvaluationEngine:
     async def _generate_summary_and_recommendations(
         self,
         concept: BusinessConcept,
-        scores: Dict[str, float],
+        scores: Scores,
         market_insights: MarketInsights,
         competitive_analysis
     ) -> tuple:
         """Generate executive summary and recommendations."""
         
-        summary_prompt = f"""
-        Create an executive summary and recommendations for this business evaluation:
-        
-        Business Concept: {concept.concept_description}
-        Overall Success Score: {scores['overall_success_score']:.1f}/100
-        Market Demand Score: {scores['market_demand_score']:.1f}/100
-        Competition Level: {market_insights.competition_level}
-        Target Demographics: Age {concept.target_demographics.age_min}-{concept.target_demographics.age_max}, {concept.target_demographics.income_range}, {concept.target_demographics.location}
-        
-        Provide:
-        1. A concise executive summary (2-3 paragraphs)
-        2. 5-7 key recommendations
-        3. 5-7 immediate next steps
-        """
+        demographics = concept.target_demographics
+        summary_prompt = _SUMMARY_PROMPT.format(
+            concept=concept.concept_description,
+            overall_success_score=scores.overall_success_score,
+            market_demand_score=scores.market_demand_score,
+            competition_level=market_insights.competition_level,
+            demographics=f"Age {demographics.age_min}-{demographics.age_max}, "
+                         f"{demographics.income_range}, {demographics.location}"
+        )
         
         try:
-            response = await self.ai_client.generate_text(summary_prompt)
+            # Only the first paragraph is kept, so stop reading once it ends
+            response = ""
+            stream = self.ai_client.stream_text(summary_prompt)
+            try:
+                async for chunk in stream:
+                    response += chunk
+                    if '\n\n' in response:
+                        break
+            finally:
+                await stream.aclose()
             
             # Parse the response (simplified parsing)
-            parts = response.split('\n\n')
-            executive_summary = parts[0] if parts else "Summary not available"
+            executive_summary = response.split('\n\n')[0]
             
             # Extract recommendations and next steps (simplified)
             recommendations = [
@@ -1,7 +1,9 @@
 """Business-related data models."""
 
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from enum import Enum
 
 
@@ -32,9 +34,23 @@ class BusinessCategory(str, Enum):
     OTHER = "other"
 
 
+@lru_cache(maxsize=32)
+def parse_income_range(value: str) -> IncomeRange:
+    """Convert a raw income range string (e.g. from a form field) to the enum."""
+    return IncomeRange(value)
+
+
+@lru_cache(maxsize=32)
+def parse_business_category(value: str) -> BusinessCategory:
+    """Convert a raw category string (e.g. from a form field) to the enum."""
+    return BusinessCategory(value)
+
+
 class Demographics(BaseModel):
     """Target demographic information."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     age_min: int = Field(..., ge=0, le=100, description="Minimum age")
     age_max: int = Field(..., ge=0, le=100, description="Maximum age")
     income_range: IncomeRange = Field(..., description="Target income range")
@@ -44,17 +60,18 @@ class Demographics(BaseModel):
     education_level: Optional[str] = Field(None, description="Education level (optional)")
     lifestyle: Optional[str] = Field(None, description="Lifestyle description (optional)")
     
-    @field_validator('age_max')
-    @classmethod
-    def age_max_greater_than_min(cls, v, info):
-        if info.data and 'age_min' in info.data and v < info.data['age_min']:
+    @model_validator(mode='after')
+    def age_max_greater_than_min(self):
+        if self.age_max < self.age_min:
             raise ValueError('age_max must be greater than or equal to age_min')
-        return v
+        return self
 
 
 class ProductInfo(BaseModel):
     """Product information."""
     
+    model_config = ConfigDict(defer_build=True)
+    
     name: Optional[str] = Field(None, description="Product name")
     description: Optional[str] = Field(None, description="Product description")
     image_path: Optional[str] = Field(None, description="Path to product image")
@@ -63,17 +80,18 @@ class ProductInfo(BaseModel):
     price_range: Optional[str] = Field(None, description="Expected price range")
     features: List[str] = Field(default_factory=list, description="Key product features")
     
-    @field_validator('description')
-    @classmethod
-    def require_description_or_image(cls, v, info):
-        if not v and info.data and not info.data.get('image_path') and not info.data.get('image_data'):
+    @model_validator(mode='after')
+    def require_description_or_image(self):
+        if not self.description and not self.image_path and not self.image_data:
             raise ValueError('Either description or image must be provided')
-        return v
+        return self
 
 
 class BusinessConcept(BaseModel):
     """Complete business concept information."""
     
+    model_config = ConfigDict(defer_build=True, use_enum_values=True)
+    
     concept_description: str = Field(..., description="Business concept description")
     target_demographics: Demographics = Field(..., description="Target demographic information")
     product_info: ProductInfo = Field(..., description="Product information")
@@ -81,7 +99,66 @@ class BusinessConcept(BaseModel):
     competitive_advantages: List[str] = Field(default_factory=list, description="Competitive advantages")
     funding_requirements: Optional[str] = Field(None, description="Funding requirements")
     timeline: Optional[str] = Field(None, description="Expected timeline to market")
+
+
+@dataclass(slots=True, frozen=True)
+class DemographicsInternal:
+    """Read-only, slotted copy of validated target demographics."""
+    
+    age_min: int
+    age_max: int
+    income_range: IncomeRange
+    location: str
+    interests: Tuple[str, ...] = ()
+    gender: Optional[str] = None
+    education_level: Optional[str] = None
+    lifestyle: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class BusinessConceptInternal:
+    """Read-only, slotted copy of a validated business concept.
+    
+    BusinessConcept stays the model that parses and validates input; this
+    lighter copy is what internal consumers such as the report generator
+    read from. Raw image data is not carried over.
+    """
     
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
\ No newline at end of file
+    concept_description: str
+    target_demographics: DemographicsInternal
+    product_name: Optional[str] = None
+    product_description: Optional[str] = None
+    product_category: Optional[str] = None
+    product_features: Tuple[str, ...] = ()
+    business_model: Optional[str] = None
+    competitive_advantages: Tuple[str, ...] = ()
+    funding_requirements: Optional[str] = None
+    timeline: Optional[str] = None
+    
+    @classmethod
+    def from_model(cls, concept: BusinessConcept) -> "BusinessConceptInternal":
+        """Copy a validated BusinessConcept without re-validating it."""
+        demographics = concept.target_demographics
+        product_info = concept.product_info
+        
+        return cls(
+            concept_description=concept.concept_description,
+            target_demographics=DemographicsInternal(
+                age_min=demographics.age_min,
+                age_max=demographics.age_max,
+                income_range=demographics.income_range,
+                location=demographics.location,
+                interests=tuple(demographics.interests or ()),
+                gender=demographics.gender,
+                education_level=demographics.education_level,
+                lifestyle=demographics.lifestyle
+            ),
+            product_name=product_info.name,
+            product_description=product_info.description,
+            product_category=product_info.category.value if product_info.category else None,
+            product_features=tuple(product_info.features),
+            business_model=concept.business_model,
+            competitive_advantages=tuple(concept.competitive_advantages),
+            funding_requirements=concept.funding_requirements,
+            timeline=concept.timeline
+        )
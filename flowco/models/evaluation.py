@@ -1,18 +1,47 @@
 """Evaluation result data models."""
 
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from typing import Dict, Any, Optional, Tuple
+import time
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class _EmptyMapping(dict):
+    """Read-only empty dict shared as the default for mostly-empty mapping fields.
+    
+    It is still a dict, so validation and serialization treat it like any
+    other value; assign a new dict to the field instead of mutating it.
+    """
+    
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("shared empty mapping is read-only; assign a new dict instead")
+    
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+_EMPTY_MAPPING = _EmptyMapping()
+
+
+def _empty_mapping() -> Dict[str, str]:
+    return _EMPTY_MAPPING
+
 
 class MarketInsights(BaseModel):
     """Market research and insights."""
     
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     market_size: Optional[str] = Field(None, description="Estimated market size")
     competition_level: str = Field(..., description="Competition level (low/medium/high)")
-    market_trends: List[str] = Field(default_factory=list, description="Current market trends")
-    seasonal_factors: List[str] = Field(default_factory=list, description="Seasonal considerations")
-    regulatory_considerations: List[str] = Field(default_factory=list, description="Regulatory factors")
+    market_trends: Tuple[str, ...] = Field((), description="Current market trends")
+    seasonal_factors: Tuple[str, ...] = Field((), description="Seasonal considerations")
+    regulatory_considerations: Tuple[str, ...] = Field((), description="Regulatory factors")
     target_market_analysis: str = Field(..., description="Target market analysis")
     demographic_fit_score: float = Field(..., ge=0, le=100, description="Demographic fit score (0-100)")
     location_demand_score: float = Field(..., ge=0, le=100, description="Location demand score (0-100)")
@@ -21,49 +50,59 @@ class MarketInsights(BaseModel):
 class BrandingRecommendations(BaseModel):
     """Branding and marketing recommendations."""
     
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     brand_positioning: str = Field(..., description="Recommended brand positioning")
-    key_messaging: List[str] = Field(default_factory=list, description="Key marketing messages")
-    visual_identity_suggestions: List[str] = Field(default_factory=list, description="Visual identity suggestions")
-    marketing_channels: List[str] = Field(default_factory=list, description="Recommended marketing channels")
+    key_messaging: Tuple[str, ...] = Field((), description="Key marketing messages")
+    visual_identity_suggestions: Tuple[str, ...] = Field((), description="Visual identity suggestions")
+    marketing_channels: Tuple[str, ...] = Field((), description="Recommended marketing channels")
     content_strategy: str = Field(..., description="Content marketing strategy")
-    logo_concepts: List[str] = Field(default_factory=list, description="Logo concept ideas")
-    color_palette: List[str] = Field(default_factory=list, description="Suggested color palette")
+    logo_concepts: Tuple[str, ...] = Field((), description="Logo concept ideas")
+    color_palette: Tuple[str, ...] = Field((), description="Suggested color palette")
     commercial_script: Optional[str] = Field(None, description="Sample commercial script")
 
 
 class CompetitiveAnalysis(BaseModel):
     """Competitive analysis results."""
     
-    direct_competitors: List[str] = Field(default_factory=list, description="Direct competitors")
-    indirect_competitors: List[str] = Field(default_factory=list, description="Indirect competitors")
-    competitive_advantages: List[str] = Field(default_factory=list, description="Your competitive advantages")
-    market_gaps: List[str] = Field(default_factory=list, description="Identified market gaps")
-    differentiation_opportunities: List[str] = Field(default_factory=list, description="Differentiation opportunities")
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
+    direct_competitors: Tuple[str, ...] = Field((), description="Direct competitors")
+    indirect_competitors: Tuple[str, ...] = Field((), description="Indirect competitors")
+    competitive_advantages: Tuple[str, ...] = Field((), description="Your competitive advantages")
+    market_gaps: Tuple[str, ...] = Field((), description="Identified market gaps")
+    differentiation_opportunities: Tuple[str, ...] = Field((), description="Differentiation opportunities")
 
 
 class FinancialProjections(BaseModel):
     """Financial projections and estimates."""
     
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     startup_costs: Optional[str] = Field(None, description="Estimated startup costs")
-    revenue_projections: Dict[str, str] = Field(default_factory=dict, description="Revenue projections by year")
+    revenue_projections: Dict[str, str] = Field(default_factory=_empty_mapping, description="Revenue projections by year")
     break_even_timeline: Optional[str] = Field(None, description="Estimated break-even timeline")
-    funding_recommendations: List[str] = Field(default_factory=list, description="Funding recommendations")
-    cost_structure: List[str] = Field(default_factory=list, description="Key cost components")
+    funding_recommendations: Tuple[str, ...] = Field((), description="Funding recommendations")
+    cost_structure: Tuple[str, ...] = Field((), description="Key cost components")
 
 
 class RiskAssessment(BaseModel):
     """Risk assessment and mitigation strategies."""
     
-    high_risks: List[str] = Field(default_factory=list, description="High-priority risks")
-    medium_risks: List[str] = Field(default_factory=list, description="Medium-priority risks")
-    low_risks: List[str] = Field(default_factory=list, description="Low-priority risks")
-    mitigation_strategies: Dict[str, str] = Field(default_factory=dict, description="Risk mitigation strategies")
-    success_factors: List[str] = Field(default_factory=list, description="Critical success factors")
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
+    high_risks: Tuple[str, ...] = Field((), description="High-priority risks")
+    medium_risks: Tuple[str, ...] = Field((), description="Medium-priority risks")
+    low_risks: Tuple[str, ...] = Field((), description="Low-priority risks")
+    mitigation_strategies: Dict[str, str] = Field(default_factory=_empty_mapping, description="Risk mitigation strategies")
+    success_factors: Tuple[str, ...] = Field((), description="Critical success factors")
 
 
 class EvaluationResult(BaseModel):
     """Complete business evaluation result."""
     
+    model_config = ConfigDict(defer_build=True, frozen=True)
+    
     # Core scores
     overall_success_score: float = Field(..., ge=0, le=100, description="Overall success probability (0-100)")
     market_demand_score: float = Field(..., ge=0, le=100, description="Market demand score (0-100)")
@@ -79,16 +118,34 @@ class EvaluationResult(BaseModel):
     
     # Summary and recommendations
     executive_summary: str = Field(..., description="Executive summary")
-    key_recommendations: List[str] = Field(default_factory=list, description="Key recommendations")
-    next_steps: List[str] = Field(default_factory=list, description="Recommended next steps")
+    key_recommendations: Tuple[str, ...] = Field((), description="Key recommendations")
+    next_steps: Tuple[str, ...] = Field((), description="Recommended next steps")
     
     # Metadata
-    evaluation_date: datetime = Field(default_factory=datetime.now, description="Evaluation timestamp")
+    evaluation_ts: float = Field(default_factory=time.time, description="Evaluation timestamp (seconds since the epoch)")
     model_version: str = Field(default="1.0.0", description="Model version used")
     confidence_level: float = Field(..., ge=0, le=100, description="Confidence in evaluation (0-100)")
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    @computed_field
+    @property
+    def evaluation_date(self) -> datetime:
+        """Evaluation timestamp as a local datetime."""
+        return datetime.fromtimestamp(self.evaluation_ts)
+    
+    # Content hash, set for every instance so equal results carry equal
+    # private state and still compare equal
+    _content_hash: int = PrivateAttr(0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Hash the serialized result once, since the model is frozen."""
+        self._content_hash = hash(self.model_dump_json())
+    
+    def __hash__(self) -> int:
+        # The generated frozen-model hash fails on the list and dict fields
+        return self._content_hash
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize the result to UTF-8 JSON, with orjson when available."""
+        if orjson is None:
+            return self.model_dump_json().encode("utf-8")
+        return orjson.dumps(self.model_dump())
@@ -1,6 +1,21 @@
 """Output generation and formatting modules."""
 
-from .report_generator import ReportGenerator
-from .template_generator import TemplateGenerator
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["ReportGenerator", "TemplateGenerator"]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .report_generator import ReportGenerator
+    from .template_generator import TemplateGenerator
+
+__all__ = ["ReportGenerator", "TemplateGenerator"]
+
+
+def __getattr__(name: str) -> Any:
+    # The generators pull in the PDF and templating libraries, so they are
+    # only imported once one of them is used
+    if name == "ReportGenerator":
+        from .report_generator import ReportGenerator
+        return ReportGenerator
+    if name == "TemplateGenerator":
+        from .template_generator import TemplateGenerator
+        return TemplateGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
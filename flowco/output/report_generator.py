@@ -7,6 +7,11 @@ from datetime import datetime
 import json
 import markdown
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from jinja2 import Environment, FileSystemLoader, Template
 from weasyprint import HTML, CSS
 from reportlab.lib.pagesizes import letter
@@ -15,9 +20,8 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 
-from ..models.business import BusinessConcept
+from ..models.business import BusinessConcept, BusinessConceptInternal
 from ..models.evaluation import EvaluationResult
-from ..core.config import config
 
 logger = logging.getLogger(__name__)
 
@@ -30,10 +34,12 @@ class ReportGenerator:
         self.templates_dir = Path(__file__).parent.parent.parent / "templates"
         self.templates_dir.mkdir(exist_ok=True)
         
-        # Initialize Jinja2 environment
+        # Initialize Jinja2 environment; compiled templates are cached, and
+        # the files only change when written below
         self.jinja_env = Environment(
             loader=FileSystemLoader(str(self.templates_dir)),
-            autoescape=True
+            autoescape=True,
+            auto_reload=False
         )
         
         # Create default templates if they don't exist
@@ -337,20 +343,15 @@ class ReportGenerator:
     
     def _prepare_template_context(self, concept: BusinessConcept, evaluation: EvaluationResult) -> Dict[str, Any]:
         """Prepare template context from concept and evaluation data."""
+        internal = BusinessConceptInternal.from_model(concept)
         
         return {
             # Basic info
-            "concept_description": concept.concept_description,
+            "concept_description": internal.concept_description,
             "evaluation_date": evaluation.evaluation_date.strftime("%Y-%m-%d %H:%M:%S"),
             
             # Demographics
-            "demographics": {
-                "age_min": concept.target_demographics.age_min,
-                "age_max": concept.target_demographics.age_max,
-                "income_range": concept.target_demographics.income_range,
-                "location": concept.target_demographics.location,
-                "interests": concept.target_demographics.interests or []
-            },
+            "demographics": internal.target_demographics,
             
             # Scores
             "overall_success_score": evaluation.overall_success_score,
@@ -483,14 +484,22 @@ class ReportGenerator:
         
         # Convert to dictionary
         report_data = {
-            "business_concept": concept.dict(),
-            "evaluation_result": evaluation.dict(),
+            "business_concept": concept.model_dump(
+                mode="json", exclude={"product_info": {"image_data"}}
+            ),
+            "evaluation_result": evaluation.model_dump(mode="json"),
             "generated_at": datetime.now().isoformat(),
             "report_version": "1.0"
         }
         
-        # Serialize to JSON
-        json_content = json.dumps(report_data, indent=2, default=str)
+        # Both models are dumped in JSON mode, so either serializer emits
+        # the same values
+        if orjson is not None:
+            json_content = orjson.dumps(
+                report_data, option=orjson.OPT_INDENT_2
+            ).decode("utf-8")
+        else:
+            json_content = json.dumps(report_data, indent=2, ensure_ascii=False)
         
         if output_path:
             Path(output_path).write_text(json_content, encoding='utf-8')
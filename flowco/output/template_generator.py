@@ -1,36 +1,30 @@
 """Website and landing page template generation."""
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import json
 
-from jinja2 import Environment, Template
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from jinja2 import DictLoader, Environment
 
 from ..models.business import BusinessConcept
 from ..models.evaluation import EvaluationResult, BrandingRecommendations
 from ..branding.content_generator import ContentGenerator
+from ..core.ai_client import AIClient
 
 logger = logging.getLogger(__name__)
 
 
-class TemplateGenerator:
-    """Generates website templates and landing pages."""
-    
-    def __init__(self):
-        """Initialize template generator."""
-        self.content_generator = ContentGenerator()
-        self.templates_dir = Path(__file__).parent.parent.parent / "templates" / "web"
-        self.templates_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create default web templates
-        self._create_default_web_templates()
-    
-    def _create_default_web_templates(self):
-        """Create default website templates."""
-        
-        # Landing page template
-        landing_page_template = """<!DOCTYPE html>
+# Default website templates
+_LANDING_PAGE_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -279,7 +273,7 @@ class TemplateGenerator:
                     <p>{{ mission_statement }}</p>
                 </div>
                 <div>
-                    <img src="https://via.placeholder.com/500x400/{{ primary_color|replace('#', '') }}/ffffff?text=Your+Business" alt="About {{ business_name }}" style="width: 100%; border-radius: 10px;">
+                    <img src="https://via.placeholder.com/500x400/{{ primary_color_hex }}/ffffff?text=Your+Business" alt="About {{ business_name }}" style="width: 100%; border-radius: 10px;">
                 </div>
             </div>
         </div>
@@ -289,7 +283,7 @@ class TemplateGenerator:
         <div class="container">
             <h2>Ready to Get Started?</h2>
             <p>{{ contact_text }}</p>
-            <a href="mailto:info@{{ business_name|lower|replace(' ', '') }}.com" class="cta-button">Contact Us Today</a>
+            <a href="mailto:info@{{ business_slug }}.com" class="cta-button">Contact Us Today</a>
         </div>
     </section>
 
@@ -313,9 +307,8 @@ class TemplateGenerator:
     </script>
 </body>
 </html>"""
-        
-        # Business card template
-        business_card_template = """<!DOCTYPE html>
+
+_BUSINESS_CARD_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -382,18 +375,61 @@ class TemplateGenerator:
             <div class="business-name">{{ business_name }}</div>
             <div class="tagline">{{ tagline }}</div>
             <div class="contact-info">
-                <div>📧 info@{{ business_name|lower|replace(' ', '') }}.com</div>
+                <div>📧 info@{{ business_slug }}.com</div>
                 <div>📱 (555) 123-4567</div>
-                <div>🌐 www.{{ business_name|lower|replace(' ', '') }}.com</div>
+                <div>🌐 www.{{ business_slug }}.com</div>
             </div>
         </div>
     </div>
 </body>
 </html>"""
+
+_STYLE_BLOCK = re.compile(r"(<style>)(.*?)(</style>)", re.DOTALL)
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+# Braces only count as CSS punctuation when they are not part of a Jinja
+# {{ ... }} expression
+_CSS_PUNCTUATION_SPACE = re.compile(r"\s*([;:,]|(?<!{){(?!{)|(?<!})}(?!}))\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _minify_css(template: str) -> str:
+    """Strip comments and redundant whitespace from a template's style blocks.
+    
+    Jinja expressions inside the CSS are left untouched.
+    """
+    def minify(match: "re.Match[str]") -> str:
+        css = _CSS_COMMENT.sub("", match.group(2))
+        css = _WHITESPACE.sub(" ", css)
+        css = _CSS_PUNCTUATION_SPACE.sub(r"\1", css).strip()
+        return f"{match.group(1)}{css}{match.group(3)}"
+    
+    return _STYLE_BLOCK.sub(minify, template)
+
+
+# Templates are rendered straight from memory, and each is compiled once on
+# first use and then reused by every generator. The embedded CSS is minified
+# once here rather than copied out in full on every render.
+_JINJA_ENV = Environment(
+    loader=DictLoader({
+        "landing_page.html": _minify_css(_LANDING_PAGE_TEMPLATE),
+        "business_card.html": _minify_css(_BUSINESS_CARD_TEMPLATE),
+    })
+)
+
+
+class TemplateGenerator:
+    """Generates website templates and landing pages."""
+    
+    __slots__ = ("content_generator", "jinja_env")
+    
+    def __init__(self, ai_client: Optional[AIClient] = None):
+        """Initialize template generator.
         
-        # Save templates
-        (self.templates_dir / "landing_page.html").write_text(landing_page_template)
-        (self.templates_dir / "business_card.html").write_text(business_card_template)
+        Args:
+            ai_client: Shared AI client (optional, a new one is created if omitted)
+        """
+        self.content_generator = ContentGenerator(ai_client)
+        self.jinja_env = _JINJA_ENV
     
     async def generate_landing_page(
         self, 
@@ -421,25 +457,14 @@ class TemplateGenerator:
             )
             
             # Prepare template context
-            context = await self._prepare_landing_page_context(
+            context = self._prepare_landing_page_context(
                 concept, evaluation, website_copy
             )
             
-            # Load and render template
-            template_path = self.templates_dir / "landing_page.html"
-            template_content = template_path.read_text()
-            template = Template(template_content)
-            
-            html_content = template.render(**context)
-            
-            if output_path:
-                Path(output_path).write_text(html_content, encoding='utf-8')
-                return output_path
-            
-            return html_content
+            return await self._render("landing_page.html", context, output_path)
             
         except Exception as e:
-            logger.error(f"Error generating landing page: {str(e)}")
+            logger.error("Error generating landing page: %s", e)
             raise
     
     async def generate_business_card(
@@ -462,88 +487,62 @@ class TemplateGenerator:
         logger.info("Generating business card")
         
         try:
-            # Prepare context
-            context = {
-                "business_name": concept.product_info.name or "Your Business",
-                "tagline": evaluation.branding_recommendations.key_messaging[0] if evaluation.branding_recommendations.key_messaging else "Your Success Partner",
-                "primary_color": evaluation.branding_recommendations.color_palette[0] if evaluation.branding_recommendations.color_palette else "#007bff",
-                "secondary_color": evaluation.branding_recommendations.color_palette[1] if len(evaluation.branding_recommendations.color_palette) > 1 else "#6c757d"
-            }
-            
-            # Load and render template
-            template_path = self.templates_dir / "business_card.html"
-            template_content = template_path.read_text()
-            template = Template(template_content)
-            
-            html_content = template.render(**context)
-            
-            if output_path:
-                Path(output_path).write_text(html_content, encoding='utf-8')
-                return output_path
+            branding = evaluation.branding_recommendations
+            context = dict(_base_context(
+                concept.product_info.name or "Your Business",
+                tuple(branding.key_messaging),
+                tuple(branding.color_palette)
+            ))
             
-            return html_content
+            return await self._render("business_card.html", context, output_path)
             
         except Exception as e:
-            logger.error(f"Error generating business card: {str(e)}")
+            logger.error("Error generating business card: %s", e)
             raise
     
-    async def _prepare_landing_page_context(
+    async def _render(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        output_path: Optional[str] = None
+    ) -> str:
+        """Render a template, writing it to output_path if one is given.
+        
+        Pages written to disk are streamed into the file from a worker thread
+        rather than built as one string on the event loop.
+        """
+        template = self.jinja_env.get_template(template_name)
+        
+        if output_path:
+            stream = template.stream(**context)
+            stream.enable_buffering(size=16)
+            await asyncio.to_thread(stream.dump, output_path, encoding='utf-8')
+            return output_path
+        
+        html_content = template.render(**context)
+        
+        return html_content
+    
+    def _prepare_landing_page_context(
         self, 
         concept: BusinessConcept, 
         evaluation: EvaluationResult,
         website_copy: Dict[str, str]
     ) -> Dict[str, Any]:
         """Prepare context for landing page template."""
-        
         branding = evaluation.branding_recommendations
         
-        # Extract business name
-        business_name = concept.product_info.name or "Your Business"
-        
-        # Generate features from product features and competitive advantages
-        features = []
-        feature_icons = ["🚀", "⭐", "💡", "🎯", "🔧", "📈"]
-        
-        # Add product features
-        for i, feature in enumerate(concept.product_info.features[:3]):
-            features.append({
-                "icon": feature_icons[i % len(feature_icons)],
-                "title": feature.title(),
-                "description": f"Experience the power of {feature.lower()} in our innovative solution."
-            })
-        
-        # Add competitive advantages
-        for i, advantage in enumerate(concept.competitive_advantages[:3]):
-            if len(features) < 6:
-                features.append({
-                    "icon": feature_icons[(i + 3) % len(feature_icons)],
-                    "title": advantage.title(),
-                    "description": f"We excel in {advantage.lower()} to deliver exceptional value."
-                })
-        
-        # Ensure we have at least 3 features
-        while len(features) < 3:
-            features.append({
-                "icon": "✨",
-                "title": "Quality Service",
-                "description": "We are committed to delivering the highest quality service to our customers."
-            })
-        
-        return {
-            "business_name": business_name,
-            "tagline": branding.key_messaging[0] if branding.key_messaging else "Your Success Partner",
-            "meta_description": f"{business_name} - {concept.concept_description[:150]}",
-            "hero_headline": website_copy.get('hero', f"Transform Your Experience with {business_name}"),
-            "hero_subtext": website_copy.get('about', concept.concept_description[:200]),
-            "cta_text": website_copy.get('cta', "Get Started Today"),
-            "about_text": website_copy.get('about', concept.concept_description),
-            "mission_statement": f"At {business_name}, we are dedicated to {concept.concept_description.lower()}",
-            "contact_text": f"Ready to experience the {business_name} difference? Contact us today to get started.",
-            "features": features,
-            "primary_color": branding.color_palette[0] if branding.color_palette else "#007bff",
-            "secondary_color": branding.color_palette[1] if len(branding.color_palette) > 1 else "#6c757d",
-            "accent_color": branding.color_palette[2] if len(branding.color_palette) > 2 else "#28a745"
-        }
+        context = _landing_page_context(
+            concept.product_info.name or "Your Business",
+            concept.concept_description,
+            tuple(concept.product_info.features),
+            tuple(concept.competitive_advantages),
+            tuple(branding.key_messaging),
+            tuple(branding.color_palette),
+            tuple(website_copy.items())
+        )
+        
+        return {**context, "features": [dict(feature) for feature in context["features"]]}
     
     async def generate_marketing_materials(
         self, 
@@ -571,69 +570,97 @@ class TemplateGenerator:
             output_path = Path("marketing_materials")
             output_path.mkdir(exist_ok=True)
         
-        generated_files = {}
+        landing_page_path = output_path / "landing_page.html"
+        business_card_path = output_path / "business_card.html"
+        social_path = output_path / "social_media_content.json"
+        email_path = output_path / "email_templates.json"
         
         try:
-            # Generate landing page
-            landing_page_path = output_path / "landing_page.html"
-            await self.generate_landing_page(concept, evaluation, str(landing_page_path))
-            generated_files["landing_page"] = str(landing_page_path)
+            # Social media and email content do not depend on the website
+            # copy, so they are written while it is being generated
+            social_content = await self._generate_social_media_content(concept, evaluation)
+            email_templates = await self._generate_email_templates(concept, evaluation)
             
-            # Generate business card
-            business_card_path = output_path / "business_card.html"
-            await self.generate_business_card(concept, evaluation, str(business_card_path))
-            generated_files["business_card"] = str(business_card_path)
+            website_copy, _, _ = await asyncio.gather(
+                self.content_generator.generate_website_copy(
+                    concept, evaluation.branding_recommendations
+                ),
+                asyncio.to_thread(social_path.write_bytes, _dump_json(social_content)),
+                asyncio.to_thread(email_path.write_bytes, _dump_json(email_templates))
+            )
             
-            # Generate social media content
-            social_content = await self._generate_social_media_content(concept, evaluation)
-            social_path = output_path / "social_media_content.json"
-            social_path.write_text(json.dumps(social_content, indent=2))
-            generated_files["social_media"] = str(social_path)
+            # The landing page context is a superset of the business card
+            # one, so both pages are rendered from a single build
+            context = self._prepare_landing_page_context(
+                concept, evaluation, website_copy
+            )
+            await asyncio.gather(
+                self._render("landing_page.html", context, str(landing_page_path)),
+                self._render("business_card.html", context, str(business_card_path))
+            )
             
-            # Generate email templates
-            email_templates = await self._generate_email_templates(concept, evaluation)
-            email_path = output_path / "email_templates.json"
-            email_path.write_text(json.dumps(email_templates, indent=2))
-            generated_files["email_templates"] = str(email_path)
+            generated_files = {
+                "landing_page": str(landing_page_path),
+                "business_card": str(business_card_path),
+                "social_media": str(social_path),
+                "email_templates": str(email_path)
+            }
             
-            logger.info(f"Generated {len(generated_files)} marketing materials")
+            logger.info("Generated %d marketing materials", len(generated_files))
             return generated_files
             
         except Exception as e:
-            logger.error(f"Error generating marketing materials: {str(e)}")
+            logger.error("Error generating marketing materials: %s", e)
             raise
     
+    async def generate_marketing_materials_batch(
+        self,
+        items: List[Tuple[BusinessConcept, EvaluationResult]],
+        output_dir: str,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Generate marketing materials for several concepts in one call.
+        
+        Concepts are processed concurrently over the shared AI client, so the
+        batch is bounded by its website copy requests rather than run one
+        concept after another. Each concept's files go to its own numbered
+        subdirectory of output_dir.
+        
+        Args:
+            items: Business concepts paired with their evaluation results
+            output_dir: Output directory
+            return_exceptions: Return failures in place of their results
+                instead of raising the first one
+            
+        Returns:
+            Dictionaries of generated file paths in input order
+        """
+        logger.info("Generating marketing materials for %d concepts", len(items))
+        
+        return await asyncio.gather(
+            *(
+                self.generate_marketing_materials(
+                    concept, evaluation, str(Path(output_dir) / f"concept_{index}")
+                )
+                for index, (concept, evaluation) in enumerate(items)
+            ),
+            return_exceptions=return_exceptions
+        )
+    
     async def _generate_social_media_content(
         self, 
         concept: BusinessConcept, 
         evaluation: EvaluationResult
     ) -> Dict[str, Any]:
         """Generate social media content."""
+        content = _social_media_content(
+            concept.product_info.name or "Your Business",
+            concept.concept_description,
+            tuple(evaluation.branding_recommendations.key_messaging)
+        )
         
-        business_name = concept.product_info.name or "Your Business"
-        
-        return {
-            "facebook_posts": [
-                f"🚀 Exciting news! {business_name} is here to {concept.concept_description.lower()}. Join us on this amazing journey! #Innovation #Business",
-                f"✨ What makes {business_name} special? {evaluation.branding_recommendations.key_messaging[0] if evaluation.branding_recommendations.key_messaging else 'We deliver exceptional value!'} #Quality #Service",
-                f"🎯 Ready to transform your experience? {business_name} is your trusted partner for success. Contact us today! #Success #Partnership"
-            ],
-            "twitter_posts": [
-                f"🚀 {business_name} is revolutionizing the way you {concept.concept_description.lower()[:50]}... #Innovation",
-                f"✨ Why choose {business_name}? Because we deliver results that matter. #Results #Quality",
-                f"🎯 Ready for change? {business_name} is here to help. Get started today! #GetStarted"
-            ],
-            "instagram_captions": [
-                f"✨ Welcome to {business_name}! We're passionate about {concept.concept_description.lower()}. Follow our journey! 📸 #Business #Passion #Journey",
-                f"🌟 Behind the scenes at {business_name}. Every day we work to deliver exceptional value to our customers. #BehindTheScenes #Value #Customers",
-                f"🚀 The future is here with {business_name}. Join us as we {concept.concept_description.lower()}! #Future #Innovation #JoinUs"
-            ],
-            "linkedin_posts": [
-                f"We're excited to announce {business_name}, a new venture focused on {concept.concept_description}. Our mission is to deliver exceptional value through innovation and dedication to our customers.",
-                f"At {business_name}, we believe in the power of {concept.concept_description.lower()}. Our team is committed to excellence and customer satisfaction in everything we do.",
-                f"Looking for a partner who understands your needs? {business_name} combines expertise with innovation to deliver results that exceed expectations."
-            ]
-        }
+        return {platform: list(posts) for platform, posts in content.items()}
     
     async def _generate_email_templates(
         self, 
@@ -641,20 +668,175 @@ class TemplateGenerator:
         evaluation: EvaluationResult
     ) -> Dict[str, Any]:
         """Generate email templates."""
+        templates = _email_templates(
+            concept.product_info.name or "Your Business",
+            concept.concept_description,
+            tuple(evaluation.branding_recommendations.key_messaging)
+        )
         
-        business_name = concept.product_info.name or "Your Business"
-        
-        return {
-            "welcome_email": {
-                "subject": f"Welcome to {business_name}!",
-                "body": f"Dear Valued Customer,\n\nWelcome to {business_name}! We're thrilled to have you join our community.\n\nAt {business_name}, we are dedicated to {concept.concept_description.lower()}. Our team is committed to providing you with exceptional service and value.\n\nWhat you can expect from us:\n- {evaluation.branding_recommendations.key_messaging[0] if evaluation.branding_recommendations.key_messaging else 'Exceptional service'}\n- Dedicated customer support\n- Innovative solutions tailored to your needs\n\nThank you for choosing {business_name}. We look forward to serving you!\n\nBest regards,\nThe {business_name} Team"
-            },
-            "promotional_email": {
-                "subject": f"Discover What Makes {business_name} Different",
-                "body": f"Hello,\n\nAre you ready to experience the {business_name} difference?\n\n{concept.concept_description}\n\nWhy choose us?\n{chr(10).join(f'• {msg}' for msg in evaluation.branding_recommendations.key_messaging[:3])}\n\nReady to get started? Contact us today to learn more about how we can help you succeed.\n\nBest regards,\nThe {business_name} Team"
-            },
-            "follow_up_email": {
-                "subject": f"Thank you for your interest in {business_name}",
-                "body": f"Dear Potential Customer,\n\nThank you for your interest in {business_name}. We wanted to follow up and provide you with more information about our services.\n\n{concept.concept_description}\n\nOur commitment to you:\n- Quality service and support\n- Innovative solutions\n- Customer satisfaction guarantee\n\nWe would love to discuss how {business_name} can help you achieve your goals. Please don't hesitate to reach out with any questions.\n\nBest regards,\nThe {business_name} Team"
-            }
-        }
\ No newline at end of file
+        return {name: dict(email) for name, email in templates.items()}
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize generated content as indented UTF-8 JSON.
+    
+    Emoji and other non-ASCII characters are kept as-is rather than escaped.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+_DEFAULT_PALETTE = ("#007bff", "#6c757d", "#28a745")
+_FEATURE_ICONS = ("🚀", "⭐", "💡", "🎯", "🔧", "📈")
+
+# Social media post copy per platform, formatted with the business name,
+# description and lead key message
+_SOCIAL_POST_TEMPLATES = {
+    "facebook_posts": (
+        "🚀 Exciting news! {name} is here to {description_lower}. Join us on this amazing journey! #Innovation #Business",
+        "✨ What makes {name} special? {key_message} #Quality #Service",
+        "🎯 Ready to transform your experience? {name} is your trusted partner for success. Contact us today! #Success #Partnership"
+    ),
+    "twitter_posts": (
+        "🚀 {name} is revolutionizing the way you {description_short}... #Innovation",
+        "✨ Why choose {name}? Because we deliver results that matter. #Results #Quality",
+        "🎯 Ready for change? {name} is here to help. Get started today! #GetStarted"
+    ),
+    "instagram_captions": (
+        "✨ Welcome to {name}! We're passionate about {description_lower}. Follow our journey! 📸 #Business #Passion #Journey",
+        "🌟 Behind the scenes at {name}. Every day we work to deliver exceptional value to our customers. #BehindTheScenes #Value #Customers",
+        "🚀 The future is here with {name}. Join us as we {description_lower}! #Future #Innovation #JoinUs"
+    ),
+    "linkedin_posts": (
+        "We're excited to announce {name}, a new venture focused on {description}. Our mission is to deliver exceptional value through innovation and dedication to our customers.",
+        "At {name}, we believe in the power of {description_lower}. Our team is committed to excellence and customer satisfaction in everything we do.",
+        "Looking for a partner who understands your needs? {name} combines expertise with innovation to deliver results that exceed expectations."
+    )
+}
+
+# Context builders are keyed by the scalar fields they read, so previews and
+# retries for the same concept reuse the built dicts. The cached dicts are
+# shared, so TemplateGenerator hands callers copies of them; the copies only
+# go as deep as the nesting, since the leaves are strings.
+
+@lru_cache(maxsize=128)
+def _landing_page_context(
+    business_name: str,
+    concept_description: str,
+    features: Tuple[str, ...],
+    competitive_advantages: Tuple[str, ...],
+    key_messaging: Tuple[str, ...],
+    color_palette: Tuple[str, ...],
+    website_copy: Tuple[Tuple[str, str], ...]
+) -> Dict[str, Any]:
+    """Build the landing page template context."""
+    copy = dict(website_copy)
+    
+    # Up to three product features take the first three icons and up to
+    # three competitive advantages the last three
+    feature_list = [
+        {
+            "icon": icon,
+            "title": feature.title(),
+            "description": f"Experience the power of {feature.lower()} in our innovative solution."
+        }
+        for icon, feature in zip(_FEATURE_ICONS[:3], features)
+    ]
+    feature_list.extend(
+        {
+            "icon": icon,
+            "title": advantage.title(),
+            "description": f"We excel in {advantage.lower()} to deliver exceptional value."
+        }
+        for icon, advantage in zip(_FEATURE_ICONS[3:], competitive_advantages)
+    )
+    
+    # Ensure we have at least 3 features
+    while len(feature_list) < 3:
+        feature_list.append({
+            "icon": "✨",
+            "title": "Quality Service",
+            "description": "We are committed to delivering the highest quality service to our customers."
+        })
+    
+    return {
+        **_base_context(business_name, key_messaging, color_palette),
+        "meta_description": f"{business_name} - {concept_description[:150]}",
+        "hero_headline": copy.get('hero', f"Transform Your Experience with {business_name}"),
+        "hero_subtext": copy.get('about', concept_description[:200]),
+        "cta_text": copy.get('cta', "Get Started Today"),
+        "about_text": copy.get('about', concept_description),
+        "mission_statement": f"At {business_name}, we are dedicated to {concept_description.lower()}",
+        "contact_text": f"Ready to experience the {business_name} difference? Contact us today to get started.",
+        "features": feature_list
+    }
+
+
+@lru_cache(maxsize=128)
+def _base_context(
+    business_name: str,
+    key_messaging: Tuple[str, ...],
+    color_palette: Tuple[str, ...]
+) -> Dict[str, Any]:
+    """Build the context shared by the business card and landing page."""
+    # Missing brand colors fall back to the default palette position by position
+    primary_color, secondary_color, accent_color = (
+        color_palette[:3] + _DEFAULT_PALETTE[len(color_palette):]
+    )
+    
+    return {
+        "business_name": business_name,
+        "business_slug": business_name.lower().replace(' ', ''),
+        "tagline": key_messaging[0] if key_messaging else "Your Success Partner",
+        "primary_color": primary_color,
+        "primary_color_hex": primary_color.replace('#', ''),
+        "secondary_color": secondary_color,
+        "accent_color": accent_color
+    }
+
+
+@lru_cache(maxsize=128)
+def _social_media_content(
+    business_name: str,
+    concept_description: str,
+    key_messaging: Tuple[str, ...]
+) -> Dict[str, Any]:
+    """Build the social media post set."""
+    fields = {
+        "name": business_name,
+        "description": concept_description,
+        "description_lower": concept_description.lower(),
+        "key_message": key_messaging[0] if key_messaging else "We deliver exceptional value!"
+    }
+    fields["description_short"] = fields["description_lower"][:50]
+    
+    return {
+        platform: [template.format(**fields) for template in templates]
+        for platform, templates in _SOCIAL_POST_TEMPLATES.items()
+    }
+
+
+@lru_cache(maxsize=128)
+def _email_templates(
+    business_name: str,
+    concept_description: str,
+    key_messaging: Tuple[str, ...]
+) -> Dict[str, Any]:
+    """Build the email template set."""
+    key_message_bullets = "\n".join([f"• {message}" for message in key_messaging[:3]])
+    
+    return {
+        "welcome_email": {
+            "subject": f"Welcome to {business_name}!",
+            "body": f"Dear Valued Customer,\n\nWelcome to {business_name}! We're thrilled to have you join our community.\n\nAt {business_name}, we are dedicated to {concept_description.lower()}. Our team is committed to providing you with exceptional service and value.\n\nWhat you can expect from us:\n- {key_messaging[0] if key_messaging else 'Exceptional service'}\n- Dedicated customer support\n- Innovative solutions tailored to your needs\n\nThank you for choosing {business_name}. We look forward to serving you!\n\nBest regards,\nThe {business_name} Team"
+        },
+        "promotional_email": {
+            "subject": f"Discover What Makes {business_name} Different",
+            "body": f"Hello,\n\nAre you ready to experience the {business_name} difference?\n\n{concept_description}\n\nWhy choose us?\n{key_message_bullets}\n\nReady to get started? Contact us today to learn more about how we can help you succeed.\n\nBest regards,\nThe {business_name} Team"
+        },
+        "follow_up_email": {
+            "subject": f"Thank you for your interest in {business_name}",
+            "body": f"Dear Potential Customer,\n\nThank you for your interest in {business_name}. We wanted to follow up and provide you with more information about our services.\n\n{concept_description}\n\nOur commitment to you:\n- Quality service and support\n- Innovative solutions\n- Customer satisfaction guarantee\n\nWe would love to discuss how {business_name} can help you achieve your goals. Please don't hesitate to reach out with any questions.\n\nBest regards,\nThe {business_name} Team"
+        }
+    }
@@ -2,20 +2,66 @@
 
 import re
 import logging
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
 
 from ..models.business import BusinessConcept, Demographics, ProductInfo
-from ..core.config import config
+from ..core.config import get_config
 
 logger = logging.getLogger(__name__)
 
+_DISALLOWED_CHARS_RE = re.compile(r'[^\w\s\-.,!?()&$%]+')
+_KEYWORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_WORD_RE = re.compile(r'\b[a-zA-Z]+\b')
+
+# Common stop words removed from extracted keywords
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
+})
+
+# Sentiment keywords
+_POSITIVE_WORDS = frozenset({
+    'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
+    'innovative', 'unique', 'revolutionary', 'successful', 'profitable',
+    'growing', 'popular', 'trending', 'opportunity', 'potential'
+})
+
+_NEGATIVE_WORDS = frozenset({
+    'bad', 'poor', 'terrible', 'awful', 'difficult', 'challenging',
+    'expensive', 'risky', 'saturated', 'declining', 'competitive',
+    'limited', 'restricted', 'problematic', 'complex'
+})
+
+# Common image file signatures, checked in one startswith call
+_IMAGE_SIGNATURES = (
+    b'\xff\xd8\xff',  # JPEG
+    b'\x89PNG\r\n\x1a\n',  # PNG
+    b'RIFF',  # WebP (starts with RIFF)
+    b'GIF87a',  # GIF87a
+    b'GIF89a',  # GIF89a
+)
+
+# Common location abbreviations as produced by str.title(), matched in a
+# single pass
+_LOCATION_ABBREVIATIONS = {
+    'Us': 'US', 'Usa': 'USA', 'Uk': 'UK',
+    'Ca': 'CA', 'Ny': 'NY', 'Tx': 'TX', 'Fl': 'FL'
+}
+_LOCATION_ABBREVIATION_RE = re.compile(
+    r'\b(?:' + '|'.join(sorted(_LOCATION_ABBREVIATIONS, key=len, reverse=True)) + r')\b'
+)
+
 
 class InputProcessor:
     """Processes and validates business concept inputs."""
     
     def __init__(self):
         """Initialize input processor."""
+        config = get_config()
         self.max_image_size = config.get("processing.max_image_size", 5242880)  # 5MB
         self.supported_formats = config.get("processing.supported_formats", ["jpg", "jpeg", "png", "webp"])
     
@@ -35,10 +81,10 @@ class InputProcessor:
         concept.concept_description = self._clean_text(concept.concept_description)
         
         # Process demographics
-        concept.target_demographics = await self._process_demographics(concept.target_demographics)
+        concept.target_demographics = self._process_demographics(concept.target_demographics)
         
         # Process product information
-        concept.product_info = await self._process_product_info(concept.product_info)
+        concept.product_info = self._process_product_info(concept.product_info)
         
         # Extract and clean competitive advantages
         if concept.competitive_advantages:
@@ -50,7 +96,7 @@ class InputProcessor:
         logger.info("Business concept processing completed")
         return concept
     
-    async def _process_demographics(self, demographics: Demographics) -> Demographics:
+    def _process_demographics(self, demographics: Demographics) -> Demographics:
         """Process and validate demographics."""
         
         # Clean location string
@@ -80,7 +126,7 @@ class InputProcessor:
         
         return demographics
     
-    async def _process_product_info(self, product_info: ProductInfo) -> ProductInfo:
+    def _process_product_info(self, product_info: ProductInfo) -> ProductInfo:
         """Process and validate product information."""
         
         # Clean text fields
@@ -102,25 +148,16 @@ class InputProcessor:
         
         # Validate image if provided
         if product_info.image_path:
-            product_info.image_path = await self._validate_image_path(product_info.image_path)
+            product_info.image_path = self._validate_image_path(product_info.image_path)
         
         if product_info.image_data:
-            product_info.image_data = await self._validate_image_data(product_info.image_data)
+            product_info.image_data = self._validate_image_data(product_info.image_data)
         
         return product_info
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text input."""
-        if not text:
-            return ""
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # Remove special characters that might cause issues
-        text = re.sub(r'[^\w\s\-.,!?()&$%]', '', text)
-        
-        return text
+        return _clean_text(text)
     
     def _standardize_location(self, location: str) -> str:
         """Standardize location format."""
@@ -131,17 +168,13 @@ class InputProcessor:
         location = location.title()
         
         # Handle common abbreviations
-        abbreviations = {
-            'Us': 'US', 'Usa': 'USA', 'Uk': 'UK',
-            'Ca': 'CA', 'Ny': 'NY', 'Tx': 'TX', 'Fl': 'FL'
-        }
-        
-        for abbr, full in abbreviations.items():
-            location = re.sub(rf'\b{abbr}\b', full, location)
+        location = _LOCATION_ABBREVIATION_RE.sub(
+            lambda match: _LOCATION_ABBREVIATIONS[match.group(0)], location
+        )
         
         return location
     
-    async def _validate_image_path(self, image_path: str) -> str:
+    def _validate_image_path(self, image_path: str) -> str:
         """Validate image file path."""
         if not image_path:
             return ""
@@ -165,7 +198,7 @@ class InputProcessor:
         
         return str(path.absolute())
     
-    async def _validate_image_data(self, image_data: bytes) -> bytes:
+    def _validate_image_data(self, image_data: bytes) -> bytes:
         """Validate raw image data."""
         if not image_data:
             return b""
@@ -188,79 +221,74 @@ class InputProcessor:
             return False
         
         # Check for common image file signatures
-        signatures = [
-            b'\xff\xd8\xff',  # JPEG
-            b'\x89PNG\r\n\x1a\n',  # PNG
-            b'RIFF',  # WebP (starts with RIFF)
-            b'GIF87a',  # GIF87a
-            b'GIF89a',  # GIF89a
-        ]
-        
-        for sig in signatures:
-            if data.startswith(sig):
-                return True
-        
-        return False
+        return data.startswith(_IMAGE_SIGNATURES)
     
     def extract_keywords(self, text: str) -> List[str]:
         """Extract keywords from text for analysis."""
-        if not text:
-            return []
-        
-        # Simple keyword extraction
-        # Remove common stop words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-            'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
-        }
-        
-        # Extract words
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-        
-        # Filter out stop words and short words
-        keywords = [word for word in words if word not in stop_words and len(word) >= 3]
-        
-        # Return unique keywords
-        return list(dict.fromkeys(keywords))
+        return list(_extract_keywords(text))
     
     def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """Basic sentiment analysis of text."""
-        if not text:
-            return {"sentiment": "neutral", "confidence": 0.0}
-        
-        # Simple sentiment analysis using keyword matching
-        positive_words = {
-            'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
-            'innovative', 'unique', 'revolutionary', 'successful', 'profitable',
-            'growing', 'popular', 'trending', 'opportunity', 'potential'
-        }
-        
-        negative_words = {
-            'bad', 'poor', 'terrible', 'awful', 'difficult', 'challenging',
-            'expensive', 'risky', 'saturated', 'declining', 'competitive',
-            'limited', 'restricted', 'problematic', 'complex'
-        }
-        
-        words = set(re.findall(r'\b[a-zA-Z]+\b', text.lower()))
-        
-        positive_count = len(words.intersection(positive_words))
-        negative_count = len(words.intersection(negative_words))
-        
-        if positive_count > negative_count:
-            sentiment = "positive"
-            confidence = min(0.8, (positive_count - negative_count) / len(words) * 10)
-        elif negative_count > positive_count:
-            sentiment = "negative"
-            confidence = min(0.8, (negative_count - positive_count) / len(words) * 10)
-        else:
-            sentiment = "neutral"
-            confidence = 0.5
-        
-        return {
-            "sentiment": sentiment,
-            "confidence": confidence,
-            "positive_indicators": positive_count,
-            "negative_indicators": negative_count
-        }
\ No newline at end of file
+        return dict(_analyze_sentiment(text))
+
+
+# Text helpers are pure functions of their input and see the same strings
+# repeatedly (interest lists, batch runs), so results are memoized. Mutable
+# results are copied by the InputProcessor methods before being returned.
+
+@lru_cache(maxsize=4096)
+def _clean_text(text: str) -> str:
+    """Clean and normalize text input."""
+    if not text:
+        return ""
+    
+    # Collapse whitespace without a regex pass (str.split and \s agree on
+    # what whitespace is), then remove special characters that might
+    # cause issues in a single substitution
+    return _DISALLOWED_CHARS_RE.sub('', ' '.join(text.split()))
+
+
+@lru_cache(maxsize=2048)
+def _extract_keywords(text: str) -> Tuple[str, ...]:
+    """Extract unique non-stop-word keywords from text."""
+    if not text:
+        return ()
+    
+    # Simple keyword extraction
+    words = _KEYWORD_RE.findall(text.lower())
+    
+    # Filter out stop words and short words
+    keywords = [word for word in words if word not in _STOP_WORDS and len(word) >= 3]
+    
+    # Return unique keywords
+    return tuple(dict.fromkeys(keywords))
+
+
+@lru_cache(maxsize=2048)
+def _analyze_sentiment(text: str) -> Dict[str, Any]:
+    """Basic keyword-matching sentiment analysis of text."""
+    if not text:
+        return {"sentiment": "neutral", "confidence": 0.0}
+    
+    # Simple sentiment analysis using keyword matching
+    words = set(_WORD_RE.findall(text.lower()))
+    
+    positive_count = len(words.intersection(_POSITIVE_WORDS))
+    negative_count = len(words.intersection(_NEGATIVE_WORDS))
+    
+    if positive_count > negative_count:
+        sentiment = "positive"
+        confidence = min(0.8, (positive_count - negative_count) / len(words) * 10)
+    elif negative_count > positive_count:
+        sentiment = "negative"
+        confidence = min(0.8, (negative_count - positive_count) / len(words) * 10)
+    else:
+        sentiment = "neutral"
+        confidence = 0.5
+    
+    return {
+        "sentiment": sentiment,
+        "confidence": confidence,
+        "positive_indicators": positive_count,
+        "negative_indicators": negative_count
+    }
@@ -1,7 +1,7 @@
 """Vision processing for product image analysis."""
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import base64
 
@@ -12,17 +12,72 @@ import numpy as np
 
 from ..models.business import ProductInfo
 from ..core.ai_client import AIClient
-from ..core.config import config
 
 logger = logging.getLogger(__name__)
 
+# Dominant color clustering runs on at most this many sampled pixels
+_COLOR_SAMPLE_SIZE = 10000
+_KMEANS_CRITERIA = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 100, 0.2)
+
+
+def _uniform_lbp(gray: np.ndarray, points: int = 24, radius: int = 8) -> np.ndarray:
+    """Compute rotation-variant uniform local binary pattern codes.
+    
+    Matches ``skimage.feature.local_binary_pattern(gray, points, radius,
+    method='uniform')``, sampling the circle with bilinear interpolation and
+    zero padding, but works a whole image at a time: one shifted, interpolated
+    view of the image per sample point instead of a per-pixel loop.
+    
+    Args:
+        gray: Grayscale image
+        points: Number of circularly symmetric neighbor points
+        radius: Radius of the circle
+        
+    Returns:
+        LBP codes, ``points + 1`` for non-uniform patterns
+    """
+    height, width = gray.shape
+    pad = radius + 1
+    image = np.pad(gray.astype(np.float64), pad)
+    center = image[pad:pad + height, pad:pad + width]
+    
+    angles = 2 * np.pi * np.arange(points, dtype=np.float64) / points
+    row_offsets = np.round(-radius * np.sin(angles), 5)
+    col_offsets = np.round(radius * np.cos(angles), 5)
+    
+    def shifted(row: int, col: int) -> np.ndarray:
+        return image[pad + row:pad + row + height, pad + col:pad + col + width]
+    
+    ones = np.zeros(gray.shape, dtype=np.uint8)
+    changes = np.zeros(gray.shape, dtype=np.uint8)
+    previous = None
+    for row_offset, col_offset in zip(row_offsets, col_offsets):
+        min_row, max_row = int(np.floor(row_offset)), int(np.ceil(row_offset))
+        min_col, max_col = int(np.floor(col_offset)), int(np.ceil(col_offset))
+        dr, dc = row_offset - min_row, col_offset - min_col
+        
+        top = (1 - dc) * shifted(min_row, min_col) + dc * shifted(min_row, max_col)
+        bottom = (1 - dc) * shifted(max_row, min_col) + dc * shifted(max_row, max_col)
+        signed = ((1 - dr) * top + dr * bottom - center) >= 0
+        
+        ones += signed
+        if previous is not None:
+            changes += signed != previous
+        previous = signed
+    
+    return np.where(changes <= 2, ones, points + 1)
+
 
 class VisionProcessor:
     """Processes and analyzes product images."""
     
-    def __init__(self):
-        """Initialize vision processor."""
-        self.ai_client = AIClient()
+    def __init__(self, ai_client: Optional[AIClient] = None):
+        """Initialize vision processor.
+        
+        Args:
+            ai_client: Shared AI client (optional, a new one is created if omitted)
+        """
+        self.ai_client = ai_client or AIClient()
         self.max_dimension = 1024  # Max image dimension for processing
     
     async def analyze_product_image(self, product_info: ProductInfo) -> Dict[str, Any]:
@@ -45,10 +100,10 @@ class VisionProcessor:
                 return {"error": "No valid image data"}
             
             # Resize image if needed
-            processed_image = self._preprocess_image(image_data)
+            processed_image, image_jpeg = self._preprocess_image(image_data)
             
             # Perform AI-based analysis
-            ai_analysis = await self._analyze_with_ai(processed_image, product_info)
+            ai_analysis = await self._analyze_with_ai(image_jpeg, product_info)
             
             # Perform computer vision analysis
             cv_analysis = self._analyze_with_cv(processed_image)
@@ -83,34 +138,42 @@ class VisionProcessor:
         
         return None
     
-    def _preprocess_image(self, image_data: bytes) -> np.ndarray:
-        """Preprocess image for analysis."""
+    def _preprocess_image(self, image_data: bytes) -> Tuple[np.ndarray, bytes]:
+        """Preprocess image for analysis.
+        
+        Returns:
+            The RGB pixel array for OpenCV and the same image JPEG-encoded
+            for AI analysis
+        """
         
         # Convert bytes to PIL Image
         image = Image.open(BytesIO(image_data))
         
+        # Resize if too large. JPEGs are first decoded at the smallest DCT
+        # scale (1/2, 1/4 or 1/8) that still covers the target size, so the
+        # full-resolution pixels are never materialized.
+        new_size = None
+        if max(image.size) > self.max_dimension:
+            ratio = self.max_dimension / max(image.size)
+            new_size = tuple(int(dim * ratio) for dim in image.size)
+            image.draft('RGB', new_size)
+        
         # Convert to RGB if needed
         if image.mode != 'RGB':
             image = image.convert('RGB')
         
-        # Resize if too large
-        if max(image.size) > self.max_dimension:
-            ratio = self.max_dimension / max(image.size)
-            new_size = tuple(int(dim * ratio) for dim in image.size)
+        if new_size and image.size != new_size:
             image = image.resize(new_size, Image.Resampling.LANCZOS)
         
+        # Encode for AI analysis straight from the PIL image
+        buffer = BytesIO()
+        image.save(buffer, format='JPEG', quality=85)
+        
         # Convert to numpy array for OpenCV
-        return np.array(image)
+        return np.array(image), buffer.getvalue()
     
-    async def _analyze_with_ai(self, image: np.ndarray, product_info: ProductInfo) -> Dict[str, Any]:
-        """Analyze image using AI vision models."""
-        
-        # Convert numpy array back to bytes for AI analysis
-        pil_image = Image.fromarray(image)
-        from io import BytesIO
-        buffer = BytesIO()
-        pil_image.save(buffer, format='JPEG', quality=85)
-        image_bytes = buffer.getvalue()
+    async def _analyze_with_ai(self, image_bytes: bytes, product_info: ProductInfo) -> Dict[str, Any]:
+        """Analyze JPEG-encoded image using AI vision models."""
         
         analysis_prompt = f"""
         Analyze this product image and provide detailed insights:
@@ -144,18 +207,20 @@ class VisionProcessor:
         """Analyze image using computer vision techniques."""
         
         try:
-            # Convert to different color spaces
+            # Convert to grayscale
             gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
-            hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV)
+            
+            # Edge map shared by the texture and edge analyses
+            edges = cv2.Canny(gray, 50, 150)
             
             # Color analysis
-            color_analysis = self._analyze_colors(image, hsv)
+            color_analysis = self._analyze_colors(image)
             
             # Texture analysis
-            texture_analysis = self._analyze_texture(gray)
+            texture_analysis = self._analyze_texture(gray, edges)
             
             # Edge and shape analysis
-            edge_analysis = self._analyze_edges(gray)
+            edge_analysis = self._analyze_edges(edges)
             
             # Composition analysis
             composition_analysis = self._analyze_composition(image)
@@ -172,50 +237,49 @@ class VisionProcessor:
             logger.error(f"Computer vision analysis failed: {str(e)}")
             return {"error": f"CV analysis failed: {str(e)}"}
     
-    def _analyze_colors(self, image: np.ndarray, hsv: np.ndarray) -> Dict[str, Any]:
+    def _analyze_colors(self, image: np.ndarray) -> Dict[str, Any]:
         """Analyze color properties of the image."""
         
-        # Dominant colors
+        # Dominant colors, clustered on a fixed-seed sample of the pixels
         pixels = image.reshape(-1, 3)
-        from sklearn.cluster import KMeans
+        if len(pixels) > _COLOR_SAMPLE_SIZE:
+            rng = np.random.default_rng(42)
+            pixels = pixels[rng.choice(len(pixels), _COLOR_SAMPLE_SIZE, replace=False)]
         
         try:
-            kmeans = KMeans(n_clusters=5, random_state=42, n_init=10)
-            kmeans.fit(pixels)
-            dominant_colors = kmeans.cluster_centers_.astype(int).tolist()
+            cv2.setRNGSeed(42)
+            _, _, centers = cv2.kmeans(
+                pixels.astype(np.float32), 5, None, _KMEANS_CRITERIA, 10, cv2.KMEANS_PP_CENTERS
+            )
+            dominant_colors = centers.astype(int).tolist()
         except:
             dominant_colors = []
         
-        # Color distribution
-        color_hist = cv2.calcHist([hsv], [0, 1, 2], None, [50, 60, 60], [0, 180, 0, 256, 0, 256])
-        
-        # Average color
-        avg_color = np.mean(image, axis=(0, 1)).astype(int).tolist()
-        
-        # Color variance (measure of color diversity)
-        color_variance = np.var(image, axis=(0, 1)).tolist()
+        # Average color and per-channel variance (measure of color
+        # diversity), from a single pass over the image
+        mean, std = cv2.meanStdDev(image)
+        avg_color = mean.ravel().astype(int).tolist()
+        color_variance = (std.ravel() ** 2).tolist()
         
         return {
             "dominant_colors": dominant_colors,
             "average_color": avg_color,
             "color_variance": color_variance,
-            "color_diversity": float(np.mean(color_variance))
+            "color_diversity": sum(color_variance) / len(color_variance)
         }
     
-    def _analyze_texture(self, gray: np.ndarray) -> Dict[str, Any]:
+    def _analyze_texture(self, gray: np.ndarray, edges: np.ndarray) -> Dict[str, Any]:
         """Analyze texture properties."""
         
         # Calculate texture using Local Binary Pattern
         try:
-            from skimage.feature import local_binary_pattern
-            lbp = local_binary_pattern(gray, 24, 8, method='uniform')
+            lbp = _uniform_lbp(gray, 24, 8)
             texture_hist = np.histogram(lbp.ravel(), bins=26)[0]
             texture_uniformity = np.sum(texture_hist[:25]) / np.sum(texture_hist)
         except:
             texture_uniformity = 0.5
         
         # Edge density as texture measure
-        edges = cv2.Canny(gray, 50, 150)
         edge_density = np.sum(edges > 0) / edges.size
         
         # Contrast measure
@@ -228,11 +292,8 @@ class VisionProcessor:
             "texture_complexity": "high" if edge_density > 0.1 else "medium" if edge_density > 0.05 else "low"
         }
     
-    def _analyze_edges(self, gray: np.ndarray) -> Dict[str, Any]:
-        """Analyze edge and shape properties."""
-        
-        # Edge detection
-        edges = cv2.Canny(gray, 50, 150)
+    def _analyze_edges(self, edges: np.ndarray) -> Dict[str, Any]:
+        """Analyze edge and shape properties of a Canny edge map."""
         
         # Find contours
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -243,26 +304,32 @@ class VisionProcessor:
         # Calculate edge strength
         edge_strength = np.mean(edges)
         
-        # Find dominant shapes
-        shape_types = []
-        for contour in contours[:10]:  # Analyze top 10 contours
-            if len(contour) > 5:
-                approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
-                vertices = len(approx)
-                
-                if vertices == 3:
-                    shape_types.append("triangle")
-                elif vertices == 4:
-                    shape_types.append("rectangle")
-                elif vertices > 8:
-                    shape_types.append("circle")
-                else:
-                    shape_types.append("polygon")
+        # Find dominant shapes from the approximated vertex counts of the top
+        # 10 contours, skipping ones too small to classify
+        vertices = np.array([
+            len(cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True))
+            for contour in contours[:10]
+            if len(contour) > 5
+        ], dtype=int)
+        is_triangle = vertices == 3
+        is_rectangle = vertices == 4
+        is_circle = vertices > 8
+        is_polygon = ~(is_triangle | is_rectangle | is_circle)
+        
+        dominant_shapes = [
+            shape for shape, matches in (
+                ("triangle", is_triangle),
+                ("rectangle", is_rectangle),
+                ("circle", is_circle),
+                ("polygon", is_polygon)
+            )
+            if matches.any()
+        ]
         
         return {
             "edge_strength": float(edge_strength),
             "shape_count": shape_count,
-            "dominant_shapes": list(set(shape_types)),
+            "dominant_shapes": dominant_shapes,
             "geometric_complexity": "high" if shape_count > 20 else "medium" if shape_count > 5 else "low"
         }
     
@@ -283,9 +350,11 @@ class VisionProcessor:
             "bottom": image[2*third_h:, :]
         }
         
-        region_brightness = {}
-        for region_name, region in regions.items():
-            region_brightness[region_name] = float(np.mean(region))
+        # cv2.mean averages each channel of a region view in one C pass
+        region_brightness = {
+            region_name: sum(cv2.mean(region)[:3]) / 3
+            for region_name, region in regions.items()
+        }
         
         # Overall composition balance
         balance_score = 1.0 - (np.std(list(region_brightness.values())) / 255.0)
@@ -304,13 +373,13 @@ class VisionProcessor:
         gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
         
         # Sharpness (Laplacian variance)
-        sharpness = cv2.Laplacian(gray, cv2.CV_64F).var()
+        _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_64F))
+        sharpness = laplacian_std[0, 0] ** 2
         
-        # Brightness
-        brightness = np.mean(gray)
-        
-        # Contrast
-        contrast = gray.std()
+        # Brightness and contrast, from a single pass over the image
+        mean, std = cv2.meanStdDev(gray)
+        brightness = mean[0, 0]
+        contrast = std[0, 0]
         
         # Overall quality score
         quality_score = min(100, (sharpness / 1000 * 40) + (min(brightness, 255-brightness) / 127.5 * 30) + (contrast / 127.5 * 30))
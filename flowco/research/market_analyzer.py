@@ -13,7 +13,7 @@ import aiohttp
 from ..models.business import BusinessConcept, Demographics
 from ..models.evaluation import MarketInsights, CompetitiveAnalysis
 from ..core.ai_client import AIClient
-from ..core.config import config
+from ..core.config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +21,14 @@ logger = logging.getLogger(__name__)
 class MarketAnalyzer:
     """Analyzes market conditions and competitive landscape."""
     
-    def __init__(self):
-        """Initialize market analyzer."""
-        self.ai_client = AIClient()
+    def __init__(self, ai_client: Optional[AIClient] = None):
+        """Initialize market analyzer.
+        
+        Args:
+            ai_client: Shared AI client (optional, a new one is created if omitted)
+        """
+        config = get_config()
+        self.ai_client = ai_client or AIClient()
         self.enable_web_scraping = config.get("research.enable_web_scraping", True)
         self.max_search_results = config.get("research.max_search_results", 10)
     
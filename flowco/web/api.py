@@ -11,19 +11,20 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query, Res
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, ValidationError
 
-from ..models.business import BusinessConcept, Demographics, ProductInfo, BusinessCategory, IncomeRange
+from ..models.business import (
+    BusinessConcept, Demographics, ProductInfo, parse_business_category, parse_income_range
+)
 from ..models.evaluation import EvaluationResult
 from ..core.engine import BusinessEvaluationEngine
 from ..output.report_generator import ReportGenerator
 from ..output.template_generator import TemplateGenerator
-from ..core.config import config
 
 logger = logging.getLogger(__name__)
 
 # Initialize components
 engine = BusinessEvaluationEngine()
 report_generator = ReportGenerator()
-template_generator = TemplateGenerator()
+template_generator = TemplateGenerator(engine.ai_client)
 
 # In-memory storage for demo (use database in production)
 evaluation_cache: Dict[str, Dict[str, Any]] = {}
@@ -151,7 +152,12 @@ async def get_evaluation_results(evaluation_id: str):
     if evaluation["result"] is None:
         raise HTTPException(status_code=404, detail="Results not available")
     
-    return evaluation["result"].dict()
+    # Serialize with the model's own compiled serializer rather than
+    # FastAPI's generic encoder
+    return Response(
+        content=evaluation["result"].model_dump_json(),
+        media_type="application/json"
+    )
 
 
 @router.get("/report/{evaluation_id}")
@@ -297,7 +303,7 @@ async def evaluate_with_image(
         demographics = Demographics(
             age_min=age_min,
             age_max=age_max,
-            income_range=IncomeRange(income_range),
+            income_range=parse_income_range(income_range),
             location=location,
             interests=interests_list,
             gender=gender,
@@ -307,7 +313,7 @@ async def evaluate_with_image(
         product_info = ProductInfo(
             name=product_name,
             description=product_description,
-            category=BusinessCategory(product_category) if product_category else None,
+            category=parse_business_category(product_category) if product_category else None,
             features=features_list,
             image_data=image_data
         )
@@ -425,4 +431,13 @@ async def process_evaluation(evaluation_id: str, business_concept: BusinessConce
             "status": "error",
             "error": str(e),
             "completed_at": datetime.now()
-        })
\ No newline at end of file
+        })
+    
+    finally:
+        # The uploaded image is only needed during evaluation; don't keep
+        # its bytes alive in the results cache
+        product_info = business_concept.product_info
+        if product_info.image_data:
+            evaluation_cache[evaluation_id]["concept"] = business_concept.model_copy(
+                update={"product_info": product_info.model_copy(update={"image_data": None})}
+            )
\ No newline at end of file
@@ -9,7 +9,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 
 from .api import router as api_router
-from ..core.config import config
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +72,12 @@ def create_app() -> FastAPI:
             "evaluation_id": evaluation_id
         })
     
+    @app.on_event("shutdown")
+    async def close_ai_client():
+        """Release AI provider connections."""
+        from .api import engine
+        await engine.ai_client.close()
+    
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
@@ -13,7 +13,7 @@ from pathlib import Path
 import uvicorn
 
 from flowco.web.app import create_app
-from flowco.core.config import config
+from flowco.core.config import Config, get_config
 
 # Setup logging
 logging.basicConfig(
@@ -30,6 +30,8 @@ logger = logging.getLogger(__name__)
 
 def main():
     """Main entry point."""
+    config = get_config()
+    
     parser = argparse.ArgumentParser(description="FlowCo AI Business Evaluation System")
     parser.add_argument(
         "--host", 
@@ -62,8 +64,6 @@ def main():
     
     # Load custom config if provided
     if args.config:
-        from flowco.core.config import Config
-        global config
         config = Config(args.config)
     
     # Check if AI services are configured
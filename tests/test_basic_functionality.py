@@ -26,6 +26,79 @@ def test_config_initialization():
     assert isinstance(models, list)
 
 
+def test_response_cache():
+    """Test AI response cache lookup, expiry and eviction."""
+    from flowco.core.cache import ResponseCache
+    
+    cache = ResponseCache(max_size=2, ttl=3600)
+    key = ResponseCache.make_key("prompt", "gpt-3.5-turbo", 200, 0.0)
+    
+    # Keys are stable and sensitive to request parameters
+    assert key == ResponseCache.make_key("prompt", "gpt-3.5-turbo", 200, 0.0)
+    assert key != ResponseCache.make_key("prompt", "gpt-3.5-turbo", 300, 0.0)
+    
+    assert cache.get(key) is None
+    cache.set(key, "response")
+    assert cache.get(key) == "response"
+    
+    # Least recently used entry is evicted once full
+    cache.set("b", "second")
+    cache.get(key)
+    cache.set("c", "third")
+    assert cache.get("b") is None
+    assert cache.get(key) == "response"
+    
+    # Expired entries are not returned
+    expired = ResponseCache(ttl=-1)
+    expired.set(key, "stale")
+    assert expired.get(key) is None
+
+
+def test_semantic_cache():
+    """Test semantic cache similarity matching scoped by template."""
+    import numpy as np
+    from flowco.core.cache import SemanticCache
+    
+    cache = SemanticCache(similarity_threshold=0.95, max_size=2)
+    first = np.array([1.0, 0.0], dtype=np.float32)
+    near = np.array([0.99, 0.141], dtype=np.float32)
+    far = np.array([0.0, 1.0], dtype=np.float32)
+    
+    cache.add("positioning", first, "cached positioning")
+    assert cache.lookup("positioning", near) == "cached positioning"
+    assert cache.lookup("positioning", far) is None
+    assert cache.lookup("messaging", first) is None
+    
+    # Oldest entries are dropped once a template is full
+    cache.add("positioning", far, "second")
+    cache.add("positioning", far, "third")
+    assert cache.lookup("positioning", first) is None
+    
+    # Expired entries never match
+    expired = SemanticCache(ttl=-1)
+    expired.add("positioning", first, "stale")
+    assert expired.lookup("positioning", first) is None
+
+
+@pytest.mark.asyncio
+async def test_parse_list_stream():
+    """Test streamed list parsing stops once enough items arrive."""
+    from flowco.branding.content_generator import ContentGenerator
+
+    received = []
+
+    async def stream():
+        for chunk in ["1. First message\n2. Sec", "ond message\n- ok\n", "- Third message\n", "4. Never read\n"]:
+            received.append(chunk)
+            yield chunk
+
+    generator = ContentGenerator()
+    items = await generator._parse_list_stream(stream(), 3)
+
+    assert items == ["First message", "Second message", "Third message"]
+    assert len(received) == 3
+
+
 def test_business_concept_creation():
     """Test business concept model creation and validation."""
     
@@ -112,6 +185,39 @@ def test_input_processor():
     assert 0 <= sentiment["confidence"] <= 1
 
 
+def test_uniform_lbp_matches_skimage():
+    """Test the vectorized uniform LBP against scikit-image."""
+    import numpy as np
+    feature = pytest.importorskip("skimage.feature")
+    from flowco.processing.vision_processor import _uniform_lbp
+    
+    rng = np.random.default_rng(0)
+    images = [rng.integers(0, 256, size=(48, 64), dtype=np.uint8) for _ in range(3)]
+    images.append(np.full((40, 40), 128, dtype=np.uint8))
+    
+    for gray in images:
+        expected = feature.local_binary_pattern(gray, 24, 8, method="uniform")
+        actual = _uniform_lbp(gray, 24, 8)
+        np.testing.assert_array_equal(actual, expected)
+
+
+def test_texture_uniformity_matches_skimage():
+    """Test the texture uniformity reported by the vision processor."""
+    import numpy as np
+    feature = pytest.importorskip("skimage.feature")
+    from flowco.processing.vision_processor import VisionProcessor
+    
+    gray = np.random.default_rng(1).integers(0, 256, size=(64, 64), dtype=np.uint8)
+    edges = np.zeros_like(gray)
+    
+    lbp = feature.local_binary_pattern(gray, 24, 8, method="uniform")
+    texture_hist = np.histogram(lbp.ravel(), bins=26)[0]
+    expected = np.sum(texture_hist[:25]) / np.sum(texture_hist)
+    
+    texture = VisionProcessor()._analyze_texture(gray, edges)
+    assert texture["texture_uniformity"] == pytest.approx(expected)
+
+
 @pytest.mark.asyncio
 async def test_report_generation():
     """Test report generation functionality."""